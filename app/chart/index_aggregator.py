@@ -13,6 +13,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Set
 import fnmatch
+from importlib.util import find_spec
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,6 +23,11 @@ from common.logger import AppLogger
 from common.time_series_aligner import TimeSeriesAligner
 
 
+def _parquet_engine_available() -> bool:
+    """Check whether pandas can find a Parquet engine (pyarrow or fastparquet)"""
+    return any(find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+
 class FilterValidator:
     """Validates and processes filter patterns"""
 
@@ -67,7 +73,7 @@ class IndexAggregator:
         Read CSV file into pandas DataFrame using existing FileHelper
 
         Args:
-            input_path: Path to input CSV file
+            input_path: Path to input CSV file (a .parquet file is read as-is with its stored dtypes)
 
         Returns:
             pandas.DataFrame with datetime index and numeric types
@@ -75,16 +81,19 @@ class IndexAggregator:
         self.logger.info(f"Reading CSV from {input_path}")
 
         try:
-            # Use existing FileHelper to read CSV as List[Dict]
-            data = FileHelper.read_csv(input_path)
+            # Parquet keeps column types, so no text parsing or conversion is needed
+            if Path(input_path).suffix == '.parquet':
+                df = pd.read_parquet(input_path)
+                self.logger.info(f"Loaded {len(df)} records with columns: {list(df.columns)}")
+                return df
+
+            # Use existing FileHelper to read CSV as an all-text DataFrame
+            df = FileHelper.read_csv_frame(input_path)
 
-            if not data:
+            if df.empty:
                 self.logger.error(f"No data found in {input_path}")
                 return pd.DataFrame()
 
-            # Convert to pandas DataFrame
-            df = pd.DataFrame(data)
-
             # Use DataFrameHelper for consistent column conversion
             from chart.index_chart import DataFrameHelper
             df = DataFrameHelper.convert_columns(df, ['period_start_date', 'period_end_date', 'timestamp'], ['holofoil_price', 'volume'])
@@ -100,17 +109,27 @@ class IndexAggregator:
             self.logger.error(f"Error reading CSV: {e}")
             return pd.DataFrame()
 
-    def write_csv(self, df: pd.DataFrame, output_path: Path) -> None:
+    def write_csv(self, df: pd.DataFrame, output_path: Path) -> bool:
         """
         Write pandas DataFrame to CSV file using existing FileHelper
 
         Args:
             df: pandas.DataFrame to write
-            output_path: Path to output CSV file
+            output_path: Path to output CSV file (a .parquet suffix writes zstd-compressed Parquet instead)
+
+        Returns:
+            True if the file was written, False if the write failed (the error is logged)
         """
         self.logger.info(f"Writing {len(df)} records to {output_path}")
 
         try:
+            if Path(output_path).suffix == '.parquet':
+                # Gap-filled rows carry string timestamps; store every date column as a typed datetime
+                date_cols = [col for col in ['period_start_date', 'period_end_date', 'timestamp'] if col in df.columns]
+                df.assign(**{col: pd.to_datetime(df[col], errors='coerce') for col in date_cols}).to_parquet(output_path, compression='zstd', index=False)
+                self.logger.info(f"Successfully wrote data to {output_path}")
+                return True
+
             # Convert DataFrame to List[Dict] for FileHelper
             data = df.to_dict('records')
 
@@ -118,8 +137,10 @@ class IndexAggregator:
             FileHelper.write_csv(data, output_path)
 
             self.logger.info(f"Successfully wrote data to {output_path}")
+            return True
         except Exception as e:
             self.logger.error(f"Error writing CSV: {e}")
+            return False
 
     def apply_filters(self, df: pd.DataFrame, sets: str = '*', types: str = '*', period: str = '3M') -> pd.DataFrame:
         """
@@ -320,6 +341,8 @@ Available Periods: 3M
                        help='Enable verbose logging')
     parser.add_argument('--allow-fallback', action='store_true',
                        help='Enable fallback mode: use date with maximum coverage when 100%% not available')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                       help='Output file format (default: csv; parquet requires pyarrow or fastparquet)')
 
     return parser
 
@@ -328,12 +351,14 @@ def main() -> None:
     """Main entry point with data directory creation"""
     parser = create_parser()
     args = parser.parse_args()
+    if args.format == 'parquet' and not _parquet_engine_available():
+        parser.error("--format parquet requires pyarrow or fastparquet to be installed")
 
     input_file = Path(args.input_csv)
     data_dir = Path("data")
     data_dir.mkdir(exist_ok=True)  # Ensure data directory exists
-    output_file = data_dir / f"{args.name}_time_series.csv"
-    raw_output_file = data_dir / f"{args.name}_time_series_raw.csv"
+    output_file = data_dir / f"{args.name}_time_series.{args.format}"
+    raw_output_file = data_dir / f"{args.name}_time_series_raw.{args.format}"
 
     aggregator = IndexAggregator()
     df = aggregator.read_csv(input_file)
@@ -345,14 +370,18 @@ def main() -> None:
         if not subset_df.empty:
             # Save the filtered raw subset data, ordered by period_end_date and set
             grouped_subset_df = subset_df.sort_values(['period_end_date', 'set'])
-            aggregator.write_csv(grouped_subset_df, raw_output_file)
+            if not aggregator.write_csv(grouped_subset_df, raw_output_file):
+                print(f"Failed to write filtered raw data to: {raw_output_file}")
+                sys.exit(1)
             print(f"Filtered raw data saved to: {raw_output_file}")
 
             # Aggregate into time series
             ts_df = aggregator.aggregate_time_series(subset_df, args.name)
 
             if not ts_df.empty:
-                aggregator.write_csv(ts_df, output_file)
+                if not aggregator.write_csv(ts_df, output_file):
+                    print(f"Failed to write time series to: {output_file}")
+                    sys.exit(1)
                 print(f"Time series saved to: {output_file}")
             else:
                 print("No time series data could be aggregated")
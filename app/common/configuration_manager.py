@@ -17,6 +17,10 @@ from common.helpers import (JsonConfigHelper, ConfigurationFactory, Configuratio
 from common.logger import AppLogger
 
 
+# Configuration names: alphanumeric, underscores, hyphens only
+_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+
 @dataclass
 class FilterConfiguration:
     """Configuration data structure matching JSON format"""
@@ -63,10 +67,11 @@ class ConfigurationManager:
         data = self._load_configurations_file()
         updating_existing = name in data["configurations"]
         existing_usage = data["configurations"][name]["usage_statistics"] if updating_existing else None
+        now = datetime.now(timezone.utc).isoformat()
         
         data["configurations"][name] = ConfigurationFactory.create_config_entry(
-            name, display_name, filters, validation_metadata, description, updating_existing, existing_usage)
-        data["last_modified"] = datetime.now(timezone.utc).isoformat()
+            name, display_name, filters, validation_metadata, description, updating_existing, existing_usage, now)
+        data["last_modified"] = now
         
         success = self._save_configurations_file(data)
         if success:
@@ -108,8 +113,9 @@ class ConfigurationManager:
         if name not in data["configurations"]:
             return False
         
-        ConfigurationManagerHelper.update_usage_stats(data["configurations"][name], "use")
-        data["last_modified"] = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc).isoformat()
+        ConfigurationManagerHelper.update_usage_stats(data["configurations"][name], "use", now)
+        data["last_modified"] = now
         
         success = self._save_configurations_file(data)
         if success:
@@ -125,8 +131,9 @@ class ConfigurationManager:
         
         config = data["configurations"][name]
         config["validation_metadata"] = new_validation_metadata
-        ConfigurationManagerHelper.update_usage_stats(config, "validate")
-        data["last_modified"] = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc).isoformat()
+        ConfigurationManagerHelper.update_usage_stats(config, "validate", now)
+        data["last_modified"] = now
         
         success = self._save_configurations_file(data)
         if success:
@@ -146,18 +153,14 @@ class ConfigurationManager:
         errors = []
         
         # Check format: alphanumeric, underscores, hyphens only
-        if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+        if not _NAME_RE.match(name):
             errors.append("Name must contain only letters, numbers, underscores, and hyphens")
         
         # Check length
         if len(name) < 1 or len(name) > 50:
             errors.append("Name must be 1-50 characters long")
         
-        # Check uniqueness (only for new configurations)
-        data = self._load_configurations_file()
-        if name in data["configurations"]:
-            # For existing configurations, this is not an error (allows updates)
-            pass
+        # Uniqueness is not checked: an existing name is not an error (allows updates), so the file is not read
         
         return len(errors) == 0, errors
     
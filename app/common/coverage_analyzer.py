@@ -12,6 +12,7 @@ import pandas as pd
 from pathlib import Path
 from dataclasses import dataclass, asdict
 import time
+import logging
 from functools import wraps
 
 # Add parent directory to path for imports
@@ -29,18 +30,18 @@ def _log_performance(method_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = func(self, *args, **kwargs)
-            duration = time.time() - start_time
-            self.logger.info(f"{method_name} completed in {duration:.2f}s")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("%s completed in %.2fs", method_name, (time.perf_counter_ns() - start_ns) / 1e9)
             return result
         return wrapper
     return decorator
 
 
-@dataclass
+@dataclass(frozen=True)
 class CoverageResult:
-    """Data structure for coverage analysis results"""
+    """Data structure for coverage analysis results (immutable once analysis produces it)"""
     filter_config: Dict[str, str]           # Original filter configuration
     coverage_percentage: float              # Coverage achieved (0.0-1.0)
     signatures_found: int                   # Number of signatures with coverage
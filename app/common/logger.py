@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -9,6 +12,7 @@ class AppLogger:
     
     _instance: Optional['AppLogger'] = None
     _initialized: bool = False
+    _listener: Optional[logging.handlers.QueueListener] = None
     
     def __new__(cls) -> 'AppLogger':
         if cls._instance is None:
@@ -49,27 +53,41 @@ class AppLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        # Clear existing handlers to avoid duplicates
+        # Clear existing handlers to avoid duplicates, flushing any queued file records first
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
+        self._stop_listener()
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
         
-        # File handler
-        file_handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
+        # Rotating file handler fed by a background queue listener so disk I/O never blocks callers
+        file_handler = logging.handlers.RotatingFileHandler(log_path, mode='a', maxBytes=10_485_760, backupCount=5, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)  # Always log debug to file
         file_handler.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        AppLogger._listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        AppLogger._listener.start()
         
         # Configure root logger
         root_logger.setLevel(logging.DEBUG)
         root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(queue_handler)
         
         return root_logger
     
+    @staticmethod
+    def _stop_listener() -> None:
+        """Drain and stop the background file listener, closing its handlers."""
+        listener, AppLogger._listener = AppLogger._listener, None
+        if listener is not None:
+            listener.stop()
+            [handler.close() for handler in listener.handlers]
+    
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         """
@@ -83,4 +101,7 @@ class AppLogger:
         """
         # Ensure AppLogger is initialized
         AppLogger()
-        return logging.getLogger(name)
\ No newline at end of file
+        return logging.getLogger(name)
+
+
+atexit.register(AppLogger._stop_listener)
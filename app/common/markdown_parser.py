@@ -1,10 +1,30 @@
 import re
-from typing import Dict, Any, List, Optional
+from datetime import date
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Any, List, Optional, Tuple
 
 from common.logger import AppLogger
 from common.helpers import DataProcessor
 
 
+# Precompiled patterns shared by every parser instance
+_RE_CODE_BLOCK = re.compile(r'```.*?```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`[^`]*`')
+_RE_HEADER = re.compile(r'^#{1,6}\s*', re.MULTILINE)
+_RE_LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_RE_BOLD = re.compile(r'\*{1,2}([^*]*)\*{1,2}')
+_RE_ITALIC = re.compile(r'_{1,2}([^_]*)_{1,2}')
+_RE_BLANK = re.compile(r'\n\s*\n\s*\n+')
+# Table = header line plus every following line that starts with '|' (line-by-line, no backtracking)
+_RE_HOLOFOIL_TABLE = re.compile(r'\|\s*Date\s*\|\s*Holofoil\s*\|[^\n]*(?:\n\|[^\n]*)*', re.IGNORECASE)
+_RE_NORMAL_TABLE = re.compile(r'\|\s*Date\s*\|\s*Normal\s*\|[^\n]*(?:\n\|[^\n]*)*', re.IGNORECASE)
+# Table data row: first two cells required, optional third (volume) cell; cells captured pre-stripped
+_RE_TABLE_ROW = re.compile(
+    r'^\|[^\S\n]*([^|\n]*?)[^\S\n]*\|[^\S\n]*([^|\n]*?)[^\S\n]*\|(?:[^\S\n]*([^|\n]*?)[^\S\n]*\|)?',
+    re.MULTILINE
+)
+
 class MarkdownParser:
     # Combined regex pattern for all markdown cleanup operations
     MARKDOWN_CLEANUP = re.compile(
@@ -23,7 +43,7 @@ class MarkdownParser:
         self.logger = AppLogger.get_logger(__name__)
 
     def parse(self, content: str) -> str:
-        self.logger.debug(f"Parsing {len(content)} characters of markdown")
+        self.logger.debug("Parsing %d characters of markdown", len(content))
 
         if not content.strip():
             return ""
@@ -31,42 +51,45 @@ class MarkdownParser:
         # Basic markdown parsing - extract text content
         parsed = self._extract_text(content)
 
-        self.logger.debug(f"Parsed to {len(parsed)} characters")
+        self.logger.debug("Parsed to %d characters", len(parsed))
         return parsed
 
-    def _extract_text(self, content: str) -> str:
-        # Remove code blocks
-        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-        # Remove inline code
-        content = re.sub(r'`[^`]*`', '', content)
-        # Remove headers (keep text)
-        content = re.sub(r'^#{1,6}\s*', '', content, flags=re.MULTILINE)
-        # Remove links (keep text)
-        content = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', content)
-        # Remove bold/italic markers
-        content = re.sub(r'\*{1,2}([^*]*)\*{1,2}', r'\1', content)
-        content = re.sub(r'_{1,2}([^_]*)_{1,2}', r'\1', content)
+    @staticmethod
+    def _extract_text(content: str) -> str:
+        # Each pass is skipped when its required literal is absent (a substring scan is far cheaper than a regex pass)
+        if '```' in content:
+            content = _RE_CODE_BLOCK.sub('', content)     # Remove code blocks
+        if '`' in content:
+            content = _RE_INLINE_CODE.sub('', content)    # Remove inline code
+        if '#' in content:
+            content = _RE_HEADER.sub('', content)         # Remove headers (keep text)
+        if '](' in content:
+            content = _RE_LINK.sub(r'\1', content)        # Remove links (keep text)
+        if '*' in content:
+            content = _RE_BOLD.sub(r'\1', content)        # Remove bold/italic markers
+        if '_' in content:
+            content = _RE_ITALIC.sub(r'\1', content)
         # Clean up excessive whitespace but preserve paragraph breaks
-        return re.sub(r'\n\s*\n\s*\n+', '\n\n', content).strip()
+        return _RE_BLANK.sub('\n\n', content).strip()
 
     def extract_price_history_table(self, content: str) -> Optional[str]:
         """Extract TCGPlayer price history table from markdown content"""
         self.logger.debug("Extracting price history table from content")
 
-        if not content.strip():
+        # Fast reject: no pipe character means no markdown table at all (also covers empty/whitespace-only
+        # content without copying the whole page through strip())
+        if '|' not in content:
             return None
 
         # Try original format first (Date | Holofoil)
-        holofoil_pattern = r'\|\s*Date\s*\|\s*Holofoil\s*\|.*?(?=\n\n|\n(?!\|)|\Z)'
-        match = re.search(holofoil_pattern, content, re.DOTALL | re.IGNORECASE)
+        match = _RE_HOLOFOIL_TABLE.search(content)
         
         if match:
             self.logger.debug("Found 'Date | Holofoil' format table")
             table_content = match.group(0).strip()
         else:
             # Try alternative format (Date | Normal)
-            normal_pattern = r'\|\s*Date\s*\|\s*Normal\s*\|.*?(?=\n\n|\n(?!\|)|\Z)'
-            match = re.search(normal_pattern, content, re.DOTALL | re.IGNORECASE)
+            match = _RE_NORMAL_TABLE.search(content)
             
             if match:
                 self.logger.debug("Found 'Date | Normal' format table")
@@ -75,14 +98,11 @@ class MarkdownParser:
                 self.logger.debug("No price history table found (tried both 'Date | Holofoil' and 'Date | Normal' formats)")
                 return None
 
-        # Clean up the table formatting
-        lines = table_content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            line = line.strip()
-            if line and line.startswith('|') and line.endswith('|'):
-                cleaned_lines.append(line)
+        # Clean up the table formatting (keep non-empty lines wrapped in pipes; index compare avoids method dispatch)
+        cleaned_lines = [
+            line for line in map(str.strip, table_content.split('\n'))
+            if line and line[0] == '|' and line[-1] == '|'
+        ]
 
         if len(cleaned_lines) < 3:  # Header + separator + at least one data row
             self.logger.debug("Table too small - needs header, separator, and data rows")
@@ -93,43 +113,54 @@ class MarkdownParser:
 
         return result
 
-    def parse_price_history_data(self, content: str) -> List[Dict[str, str]]:
-        """Parse price history table into structured data"""
+    def parse_price_history_data(self, content: str, timestamp: Optional[str] = None) -> List[Dict[str, str]]:
+        """Parse price history table into structured data, stamping records with the given (or current) timestamp"""
         self.logger.debug("Parsing price history table into structured data")
 
         table_content = self.extract_price_history_table(content)
         if not table_content:
             return []
 
-        # Skip header and separator, process data rows with list comprehension
-        raw_data_rows = [
+        # Convert to v2.0 format with separate date fields and timestamp (records memoized per table and year)
+        current_timestamp = timestamp or DataProcessor.get_current_timestamp()
+        data_rows = [
             {
-                'date': cells[0].strip(),
-                'holofoil': cells[1].strip() if len(cells) > 1 else '',
-                'price': cells[2].strip() if len(cells) > 2 else ''
-            }
-            for line in table_content.split('\n')[2:]
-            if line.strip() and line.startswith('|')
-            for cells in [[cell.strip() for cell in line.split('|')[1:-1]]]
-            if len(cells) >= 2
-        ]
-
-        # Convert to v2.0 format with separate date fields and timestamp
-        data_rows = []
-        current_timestamp = DataProcessor.get_current_timestamp()
-
-        for row in raw_data_rows:
-            start_date, end_date = DataProcessor.parse_date_range(row['date'])
-
-            # Create v2.0 format row with numeric price and integer volume
-            v2_row = {
                 'period_start_date': start_date,
                 'period_end_date': end_date,
                 'timestamp': current_timestamp,
-                'holofoil_price': DataProcessor.convert_currency_to_float(row['holofoil']),
-                'volume': DataProcessor.convert_currency_to_int(row['price'])
+                'holofoil_price': holofoil_price,
+                'volume': volume
             }
-            data_rows.append(v2_row)
+            for start_date, end_date, holofoil_price, volume in self._parse_table_records(table_content, date.today().year)
+        ]
 
         self.logger.info(f"Parsed {len(data_rows)} price history records in v2.0 format")
-        return data_rows
\ No newline at end of file
+        return data_rows
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_table_records(table_content: str, current_year: int) -> Tuple[Tuple[str, str, float, int], ...]:
+        """Parse table data rows into immutable (start_date, end_date, price, volume) tuples dated in current_year
+
+        The year is part of the cache key so a long-running process does not keep serving last year's dates.
+        """
+        # Skip header and separator, then capture row cells in a single regex scan
+        parts = table_content.split('\n', 2)
+        if len(parts) < 3:
+            return ()
+        cell_rows = _RE_TABLE_ROW.findall(parts[2])
+        if not cell_rows:
+            return ()
+
+        # Convert whole columns in one batch rather than row by row
+        dates = [cells[0] for cells in cell_rows]
+        holofoils = [cells[1] for cells in cell_rows]
+        volumes = [cells[2] for cells in cell_rows]
+        return tuple(
+            (start_date, end_date, price, volume)
+            for (start_date, end_date), price, volume in zip(
+                map(DataProcessor._parse_date_range_in_year, dates, repeat(current_year)),
+                map(DataProcessor.convert_currency_to_float, holofoils),
+                map(DataProcessor.convert_currency_to_int, volumes),
+            )
+        )
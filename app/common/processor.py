@@ -1,6 +1,10 @@
 import csv
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from common.web_client import WebClient
 from common.markdown_parser import MarkdownParser
@@ -8,12 +12,24 @@ from common.logger import AppLogger
 from common.helpers import FileHelper, DataProcessor
 
 
+# Input columns carried onto every v2.0 output record
+_INPUT_FIELDS = ('set', 'type', 'period', 'name')
+
+# Rows submitted to the fetch pool ahead of the oldest unfinished row, per worker
+_IN_FLIGHT_PER_WORKER = 2
+
+
 class CsvProcessor(DataProcessor):
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, cache_dir: Optional[Path] = None):
         self.logger = AppLogger.get_logger(__name__)
-        self.web_client = WebClient()
+        self.max_workers = max_workers
+        self.web_client = WebClient(pool_size=max(1, max_workers), cache_dir=cache_dir)
         self.markdown_parser = MarkdownParser()
         self.results = []
+        # URL -> markdown cache so duplicate input URLs are fetched once; process() resets it so it lives for one run
+        self._fetch_cache: Dict[str, str] = {}
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._fetch_locks_guard = threading.Lock()
 
     def process(self, input_file: Path) -> List[Dict]:
         self.logger.info(f"Processing file: {input_file}")
@@ -22,6 +38,9 @@ class CsvProcessor(DataProcessor):
         self._validate_input_schema(input_file)
 
         rows = self._read_csv(input_file)
+        # Start each run with an empty fetch cache so pages changed since the last run are fetched again
+        self._fetch_cache.clear()
+        self._fetch_locks.clear()
         self.results = self._process_rows(rows)
 
         # Validate output matches v2.0 schema (only for TCGPlayer price data)
@@ -30,54 +49,93 @@ class CsvProcessor(DataProcessor):
 
         return self.results
 
-    def _read_csv(self, file_path: Path) -> List[Dict]:
+    def _read_csv(self, file_path: Path) -> Iterator[Dict]:
         self.logger.info(f"Reading CSV file: {file_path}")
-        rows = FileHelper.read_csv(file_path)
-        if not rows:
+        # Stream rows so fetching starts before the whole file is parsed; peek one row to detect emptiness
+        rows = FileHelper.iter_csv(file_path)
+        first = next(rows, None)
+        if first is None:
             raise ValueError(f"CSV file '{file_path}' is empty or contains no data rows")
-        self.logger.info(f"Read {len(rows)} rows")
-        return rows
+        return chain([first], rows)
 
-    def _process_rows(self, rows: List[Dict]) -> List[Dict]:
+    def _process_rows(self, rows: Iterable[Dict]) -> List[Dict]:
         self.logger.info("Processing rows...")
+
+        # One timestamp per batch, shared by every record (including error rows) produced in this run
+        timestamp = DataProcessor.get_current_timestamp()
+
+        # Fetches are network-bound, so keep several in flight, but read ahead only a bounded window of rows
+        # (executor.map would drain the whole input up front); collecting the oldest future first preserves input order
+        workers = max(1, self.max_workers)
+        window = workers * _IN_FLIGHT_PER_WORKER
         processed_rows = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, row in self._rows_with_url(rows):
+                if len(pending) >= window:
+                    processed_rows.extend(pending.popleft().result())
+                pending.append(executor.submit(self._process_row, i, row, timestamp))
+            while pending:
+                processed_rows.extend(pending.popleft().result())
 
-        for i, row in enumerate(rows, 1):
-            self.logger.debug(f"Processing row {i}/{len(rows)}")
+        self.logger.info(f"Processed {len(processed_rows)} rows")
+        return processed_rows
 
-            if 'url' not in row:
+    def _rows_with_url(self, rows: Iterable[Dict]) -> Iterator[Tuple[int, Dict]]:
+        """Number rows and drop those without a 'url' before they reach the fetch pool"""
+        for i, row in enumerate(rows, 1):
+            if 'url' in row:
+                yield i, row
+            else:
                 self.logger.warning(f"Row {i} missing 'url' column, skipping")
-                continue
-
-            try:
-                markdown_content = self.web_client.fetch(row['url'])
-                parsed_content = self.markdown_parser.parse(markdown_content)
-
-                # Extract price history from TCGPlayer URLs
-                if self._is_tcgplayer_url(row['url']):
-                    price_data = self.markdown_parser.parse_price_history_data(markdown_content)
-                    if price_data:
-                        self.logger.info(f"Extracted {len(price_data)} price history records for row {i}")
-                        # One-liner normalized row creation for each price record (v2.0 format)
-                        processed_rows.extend([{**{k: row.get(k, '') for k in ['set', 'type', 'period', 'name']}, **price_record} for price_record in price_data])
-                    else:
-                        self.logger.warning(f"No price history found for TCGPlayer URL in row {i}, skipping")
+
+    def _process_row(self, i: int, row: Dict, timestamp: str) -> List[Dict]:
+        """Fetch and parse a single input row, returning its v2.0 output records"""
+        self.logger.debug("Processing row %d", i)
+
+        url = row['url']
+        # Build the carried-over input fields once per row, not once per price record
+        base = {k: row.get(k, '') for k in _INPUT_FIELDS}
+        processed_rows = []
+        try:
+            markdown_content = self._fetch_cached(url)
+
+            # Extract price history from TCGPlayer URLs
+            if self._is_tcgplayer_url(url):
+                price_data = self.markdown_parser.parse_price_history_data(markdown_content, timestamp=timestamp)
+                if price_data:
+                    self.logger.info(f"Extracted {len(price_data)} price history records for row {i}")
+                    # One-liner normalized row creation for each price record (v2.0 format)
+                    processed_rows.extend([base | price_record for price_record in price_data])
                 else:
-                    self.logger.warning(f"Non-TCGPlayer URL in row {i}, skipping: {row['url']}")
+                    self.logger.warning(f"No price history found for TCGPlayer URL in row {i}, skipping")
+            else:
+                self.logger.warning(f"Non-TCGPlayer URL in row {i}, skipping: {url}")
 
-                self.logger.debug(f"Successfully processed row {i}")
+            self.logger.debug("Successfully processed row %d", i)
 
-            except Exception as e:
-                self.logger.error(f"Failed to process row {i}: {e}")
-                # One-liner normalized error row creation (v2.0 format)
-                processed_rows.append({**{k: row.get(k, '') for k in ['set', 'type', 'period', 'name']}, **{'period_start_date': '', 'period_end_date': '', 'timestamp': DataProcessor.get_current_timestamp(), 'holofoil_price': 0.0, 'volume': 0}})
+        except Exception as e:
+            self.logger.error(f"Failed to process row {i}: {e}")
+            # One-liner normalized error row creation (v2.0 format)
+            processed_rows.append(base | {'period_start_date': '', 'period_end_date': '', 'timestamp': timestamp, 'holofoil_price': 0.0, 'volume': 0})
 
-        self.logger.info(f"Processed {len(processed_rows)} rows")
         return processed_rows
 
+    def _fetch_cached(self, url: str) -> str:
+        """Fetch URL content once per run; concurrent rows for the same URL wait on the first fetch"""
+        with self._fetch_locks_guard:
+            url_lock = self._fetch_locks.setdefault(url, threading.Lock())
+        with url_lock:
+            if url not in self._fetch_cache:
+                self._fetch_cache[url] = self.web_client.fetch(url)
+            else:
+                self.logger.debug("Using cached content for %s", url)
+            return self._fetch_cache[url]
+
     def _is_tcgplayer_url(self, url: str) -> bool:
         """Check if URL is a TCGPlayer product page"""
-        return 'tcgplayer.com' in url.lower()
+        # Try the allocation-free exact-case scan first; only mixed-case URLs pay for lower()
+        return 'tcgplayer.com' in url or 'tcgplayer.com' in url.lower()
 
 
     def _calculate_price_trend(self, price_data: List[Dict]) -> str:
@@ -87,8 +145,8 @@ class CsvProcessor(DataProcessor):
 
         try:
             # One-liner price extraction and conversion using DataProcessor
-            first_price = DataProcessor.convert_currency_to_float(price_data[-1]['holofoil']) if price_data else 0.0
-            last_price = DataProcessor.convert_currency_to_float(price_data[0]['holofoil']) if price_data else 0.0
+            first_price = DataProcessor.convert_currency_to_float(price_data[-1]['holofoil'])
+            last_price = DataProcessor.convert_currency_to_float(price_data[0]['holofoil'])
 
             if first_price == 0:
                 return 'no_baseline'
@@ -11,8 +11,12 @@ The aligner operates on pre-filtered DataFrames and provides:
 - Complete dataset output with all signatures included
 """
 
+import logging
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Union
 import sys
 
 # Add parent directory to path for imports
@@ -21,6 +25,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.logger import AppLogger
 
 
+# Columns that together identify one time series signature
+SIGNATURE_COLUMNS = ['set', 'type', 'period', 'name']
+
+
+@dataclass
+class CoverageKeys:
+    """Per-row signature and date codes shared by the alignment steps"""
+    signature_codes: np.ndarray             # Dense signature code per row (-1 where any key is missing)
+    total_signatures: int                   # Number of distinct signatures
+    date_codes: np.ndarray                  # Position of each row's period_end_date in dates (-1 for NaT)
+    dates: pd.DatetimeIndex                 # Sorted unique period_end_date values
+
+    def take(self, rows) -> 'CoverageKeys':
+        """Keys for a positional subset of the rows (codes and dates keep their meaning)"""
+        return CoverageKeys(self.signature_codes[rows], self.total_signatures, self.date_codes[rows], self.dates)
+
+
 class TimeSeriesAligner:
     """
     Handles completeness-only time series alignment for TCGPlayer price data.
@@ -36,7 +57,36 @@ class TimeSeriesAligner:
     def __init__(self):
         self.logger = AppLogger.get_logger(__name__)
     
-    def _1_find_first_complete_coverage_date(self, df: pd.DataFrame, allow_fallback: bool = False) -> tuple[pd.Timestamp, float]:
+    @staticmethod
+    def _signature_codes(df: pd.DataFrame) -> tuple[np.ndarray, int]:
+        """Factorize the signature columns into dense int codes (-1 where any key is missing) and the signature count"""
+        combined = np.zeros(len(df), dtype=np.int64)
+        valid = np.ones(len(df), dtype=bool)
+        for col in SIGNATURE_COLUMNS:
+            col_codes, col_uniques = pd.factorize(df[col])
+            valid &= col_codes >= 0
+            # Re-factorize after each column so the combined key stays dense and cannot overflow
+            combined = pd.factorize(combined * (len(col_uniques) + 1) + col_codes)[0]
+        codes, uniques = pd.factorize(combined[valid])
+        signature_codes = np.full(len(df), -1, dtype=np.intp)
+        signature_codes[valid] = codes
+        return signature_codes, len(uniques)
+    
+    def _coverage_keys(self, df: pd.DataFrame) -> CoverageKeys:
+        """Factorize signatures and period_end_date once so both alignment steps can share them"""
+        signature_codes, total_signatures = self._signature_codes(df)
+        date_codes, dates = pd.factorize(df['period_end_date'], sort=True)
+        return CoverageKeys(signature_codes, total_signatures, date_codes, pd.DatetimeIndex(dates))
+    
+    @staticmethod
+    def _rows_from_date(df: pd.DataFrame, start_date: pd.Timestamp) -> Union[slice, np.ndarray]:
+        """Positional indexer for rows with period_end_date >= start_date (binary search when dates are sorted)"""
+        dates = df['period_end_date']
+        if pd.api.types.is_datetime64_dtype(dates) and dates.is_monotonic_increasing:
+            return slice(int(dates.searchsorted(start_date, side='left')), None)
+        return (dates >= start_date).to_numpy()
+
+    def _1_find_first_complete_coverage_date(self, df: pd.DataFrame, allow_fallback: bool = False, keys: Optional[CoverageKeys] = None) -> tuple[pd.Timestamp, float]:
         """
         Find the first period_end_date where all signatures have complete coverage.
         
@@ -47,6 +97,7 @@ class TimeSeriesAligner:
         Args:
             df: Pre-filtered DataFrame (after user filters applied)
             allow_fallback: If True, use date with maximum coverage when 100% not available
+            keys: Precomputed signature/date codes for df (computed here when omitted)
             
         Returns:
             tuple: (optimal_date, coverage_percentage) or (None, 0.0) if no suitable date found
@@ -54,58 +105,40 @@ class TimeSeriesAligner:
         if df.empty:
             return None, 0.0
         
-        # Get all unique signatures directly
-        signatures = df.groupby(['set', 'type', 'period', 'name']).size().index.tolist()
-        if not signatures:
+        # Count unique signatures from factorized keys (no per-row tuple hashing)
+        keys = keys if keys is not None else self._coverage_keys(df)
+        total_signatures = keys.total_signatures
+        if not total_signatures:
             return None, 0.0
         
-        total_signatures = len(signatures)
-        
-        # Analyze date coverage across all signatures
-        from collections import defaultdict
-        date_coverage = defaultdict(list)
+        # Analyze date coverage across all signatures: one count of keyed records per sorted date
+        keyed = (keys.signature_codes >= 0) & (keys.date_codes >= 0)
+        counts = np.bincount(keys.date_codes[keyed], minlength=len(keys.dates))
         
-        # Group by signature to get their date coverage
-        grouped = df.groupby(['set', 'type', 'period', 'name'])
-        for signature, group in grouped:
-            for date in group['period_end_date']:
-                date_coverage[date].append(signature)
-        
-        # Find first date with complete coverage (all signatures present)
-        sorted_dates = sorted(date_coverage.keys())
-        
-        # Look for 100% coverage first
-        for date in sorted_dates:
-            signatures_on_date = len(date_coverage[date])
-            if signatures_on_date == total_signatures:
-                coverage_pct = 100.0
-                self.logger.info(f"First complete coverage date: {date.strftime('%Y-%m-%d')} with all {total_signatures} signatures ({coverage_pct:.1f}%)")
-                return date, coverage_pct
+        # Look for 100% coverage first (first date with complete coverage, all signatures present)
+        complete_positions = np.flatnonzero(counts == total_signatures)
+        if len(complete_positions):
+            date = keys.dates[complete_positions[0]]
+            coverage_pct = 100.0
+            self.logger.info(f"First complete coverage date: {date.strftime('%Y-%m-%d')} with all {total_signatures} signatures ({coverage_pct:.1f}%)")
+            return date, coverage_pct
         
         # If no complete coverage found, check fallback behavior
-        if allow_fallback:
-            # Find date with maximum coverage percentage
-            best_date = None
-            best_coverage = 0
-            best_coverage_pct = 0.0
-            
-            for date in sorted_dates:
-                signatures_on_date = len(date_coverage[date])
-                if signatures_on_date > best_coverage:
-                    best_date = date
-                    best_coverage = signatures_on_date
-                    best_coverage_pct = (signatures_on_date / total_signatures) * 100.0
-            
-            if best_date:
-                self.logger.warning(f"No date with 100% coverage found. Using fallback: {best_date.strftime('%Y-%m-%d')} with {best_coverage}/{total_signatures} signatures ({best_coverage_pct:.1f}%)")
-                return best_date, best_coverage_pct
+        if allow_fallback and len(counts):
+            # Find (earliest) date with maximum coverage percentage
+            best_position = int(counts.argmax())
+            best_date = keys.dates[best_position]
+            best_coverage = int(counts[best_position])
+            best_coverage_pct = (best_coverage / total_signatures) * 100.0
+            self.logger.warning(f"No date with 100% coverage found. Using fallback: {best_date.strftime('%Y-%m-%d')} with {best_coverage}/{total_signatures} signatures ({best_coverage_pct:.1f}%)")
+            return best_date, best_coverage_pct
         
         # Default: return None for empty DataFrame behavior
         self.logger.warning(f"No date found with complete coverage (100% signatures). Returning empty result.")
         self.logger.info("Use allow_fallback=True to enable maximum coverage fallback mode.")
         return None, 0.0
 
-    def _2_fill_signature_gaps_after_first_complete_date(self, df: pd.DataFrame, first_complete_date: pd.Timestamp, report_coverage: bool = False) -> pd.DataFrame:
+    def _2_fill_signature_gaps_after_first_complete_date(self, df: pd.DataFrame, first_complete_date: pd.Timestamp, report_coverage: bool = False, keys: Optional[CoverageKeys] = None) -> pd.DataFrame:
         """
         Fill missing signature gaps after the first complete coverage date.
         
@@ -117,6 +150,7 @@ class TimeSeriesAligner:
         Args:
             df: Pre-filtered DataFrame (after user filters applied)
             first_complete_date: The first date with complete coverage
+            keys: Precomputed signature/date codes for df (computed here when omitted)
             
         Returns:
             DataFrame with gaps filled to ensure complete signature coverage
@@ -124,85 +158,74 @@ class TimeSeriesAligner:
         if df.empty or first_complete_date is None:
             return df
         
-        # Get all unique signatures and dates
-        signatures = df.groupby(['set', 'type', 'period', 'name']).size().index.tolist()
-        all_dates = sorted(df['period_end_date'].unique())
-        
-        # Filter dates to only those at or after first complete date
-        target_dates = [date for date in all_dates if date >= first_complete_date]
-        
-        self.logger.info(f"Filling gaps for {len(signatures)} signatures across {len(target_dates)} dates from {first_complete_date.strftime('%Y-%m-%d')}")
+        # Get all unique signatures and dates as factorized codes; covered dates are the sorted tail from the start date
+        keys = keys if keys is not None else self._coverage_keys(df)
+        covered_rows = self._rows_from_date(df, first_complete_date)
+        covered_df = df.iloc[covered_rows]
+        covered_keys = keys.take(covered_rows)
+        first_target = int(keys.dates.searchsorted(first_complete_date, side='left'))
+        target_index = keys.dates[first_target:]
+        has_key = covered_keys.signature_codes >= 0
+        present_signatures = np.count_nonzero(np.bincount(covered_keys.signature_codes[has_key], minlength=keys.total_signatures))
         
-        # Analyze current coverage
-        from collections import defaultdict
-        current_coverage = defaultdict(set)
-        for _, row in df.iterrows():
-            date = row['period_end_date']
-            if date >= first_complete_date:
-                sig = (row['set'], row['type'], row['period'], row['name'])
-                current_coverage[date].add(sig)
+        self.logger.info(f"Filling gaps for {present_signatures} signatures across {len(target_index)} dates from {first_complete_date.strftime('%Y-%m-%d')}")
         
-        # Create list to store gap-fill records
-        gap_fill_records = []
+        # Lay the latest original row position per (signature, date) on a dense grid (-1 = no record);
+        # maximum.at keeps the last duplicate, and gap-filled rows never become sources.
+        # Row positions fit in int32 for any realistic frame, halving the bytes every grid pass moves
+        position_dtype = np.int32 if len(covered_df) < np.iinfo(np.int32).max else np.intp
+        grid = np.full((keys.total_signatures, len(target_index)), -1, dtype=position_dtype)
+        np.maximum.at(grid, (covered_keys.signature_codes[has_key], covered_keys.date_codes[has_key] - first_target), np.flatnonzero(has_key).astype(position_dtype))
         
-        # Track the most recent record for each signature (for gap filling)
-        signature_latest_record = {}
+        # The first target date is never filled, and only seeds later fills when it is the first complete date itself
+        sources = grid.copy()
+        if len(target_index) and target_index[0] != first_complete_date:
+            sources[:, 0] = -1
         
-        # Initialize with records from first complete date
-        first_date_records = df[df['period_end_date'] == first_complete_date]
-        for _, row in first_date_records.iterrows():
-            sig = (row['set'], row['type'], row['period'], row['name'])
-            signature_latest_record[sig] = row.to_dict()
+        # Forward-fill positions along the date axis: carry each cell's column index of its latest source
+        source_cols = np.maximum.accumulate(np.where(sources >= 0, np.arange(len(target_index), dtype=position_dtype), 0), axis=1)
+        filled = np.take_along_axis(sources, source_cols, axis=1)
+        gap_mask = (grid < 0) & (filled >= 0)
+        gap_mask[:, :1] = False
+        gaps_filled = int(gap_mask.sum())
         
-        gaps_filled = 0
-        
-        # Process each date after first complete date
-        for date in target_dates[1:]:  # Skip first date as it's already complete
-            missing_signatures = set(signatures) - current_coverage[date]
+        # Combine filtered data (from optimal start date) with gap-fill records
+        if gaps_filled:
+            gap_sig_rows, gap_date_cols = np.nonzero(gap_mask)
+            source_rows = filled[gap_sig_rows, gap_date_cols]
+            gap_dates = pd.Series(target_index[gap_date_cols])
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for date, count in gap_dates.value_counts(sort=False).sort_index().items():
+                    self.logger.debug(f"Date {date.strftime('%Y-%m-%d')}: filling {count} missing signatures")
             
-            if missing_signatures:
-                self.logger.debug(f"Date {date.strftime('%Y-%m-%d')}: filling {len(missing_signatures)} missing signatures")
-                
-                for missing_sig in missing_signatures:
-                    # Get the most recent record for this signature
-                    if missing_sig in signature_latest_record:
-                        base_record = signature_latest_record[missing_sig].copy()
-                        
-                        # Update the date fields for the new record
-                        base_record['period_end_date'] = date
-                        
-                        # Calculate new period_start_date (assuming 3-day periods based on existing data pattern)
-                        from datetime import timedelta
-                        if 'period_start_date' in base_record:
-                            days_diff = (pd.to_datetime(base_record['period_end_date']) - pd.to_datetime(base_record['period_start_date'])).days
-                            base_record['period_start_date'] = date - timedelta(days=days_diff)
-                        
-                        # Update timestamp to indicate this is a gap-filled record
-                        base_record['timestamp'] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        gap_fill_records.append(base_record)
-                        gaps_filled += 1
-                        
-                        self.logger.debug(f"  Filled gap for {missing_sig[0]} {missing_sig[3][:20]} with price {base_record.get('holofoil_price', 'N/A')}")
+            # Gather the copied source records column by column, then move them to the gap date;
+            # period_start_date keeps the copied start, floored to whole days
+            gap_columns = {col: covered_df[col].array.take(source_rows) for col in covered_df.columns}
+            gap_columns['period_end_date'] = gap_dates
+            if 'period_start_date' in gap_columns:
+                start_dates = pd.Series(gap_columns['period_start_date'])
+                if not pd.api.types.is_datetime64_dtype(start_dates):
+                    start_dates = pd.to_datetime(start_dates)
+                gap_columns['period_start_date'] = gap_dates - (gap_dates - start_dates).dt.floor('D')
             
-            # Update latest records with current date data (for next iteration)
-            current_date_records = df[df['period_end_date'] == date]
-            for _, row in current_date_records.iterrows():
-                sig = (row['set'], row['type'], row['period'], row['name'])
-                signature_latest_record[sig] = row.to_dict()
-        
-        # Combine filtered data (from optimal start date) with gap-fill records
-        if gap_fill_records:
-            gap_fill_df = pd.DataFrame(gap_fill_records)
-            # Only include records from optimal start date forward
-            filtered_original = df[df['period_end_date'] >= first_complete_date] if first_complete_date else df
-            filled_df = pd.concat([filtered_original, gap_fill_df], ignore_index=True)
+            # Update timestamp to indicate these are gap-filled records
+            gap_columns['timestamp'] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+            gap_fill_df = pd.DataFrame(gap_columns)
+            
+            # The string gap timestamps turn the combined column into object; box each distinct
+            # original timestamp once rather than letting concat box every covered row
+            if 'timestamp' in covered_df.columns and pd.api.types.is_datetime64_any_dtype(covered_df['timestamp']):
+                timestamp_codes, timestamp_uniques = pd.factorize(covered_df['timestamp'])
+                boxed_timestamps = np.append(timestamp_uniques.astype(object).to_numpy(), pd.NaT)
+                covered_df = covered_df.assign(timestamp=pd.Series(boxed_timestamps[timestamp_codes], index=covered_df.index, dtype=object))
+            
+            filled_df = pd.concat([covered_df, gap_fill_df], ignore_index=True)
             self.logger.info(f"Filled {gaps_filled} signature gaps to ensure complete coverage")
-            return filled_df.sort_values(['period_end_date', 'set', 'name']).reset_index(drop=True)
+            return filled_df.sort_values(['period_end_date', 'set', 'name'], ignore_index=True)
         else:
             self.logger.info("No gaps found - complete signature coverage already exists")
-            # Return only records from optimal start date forward
-            return df[df['period_end_date'] >= first_complete_date] if first_complete_date else df
+            # Return only records from optimal start date forward (a positional slice still shares the input's memory)
+            return covered_df.copy() if isinstance(covered_rows, slice) else covered_df
 
     def align_permissive(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -231,13 +254,15 @@ class TimeSeriesAligner:
             return pd.DataFrame()
         
         # Step 1: Find first complete coverage date for optimal alignment starting point
-        first_complete_date, coverage_pct = self._1_find_first_complete_coverage_date(df, allow_fallback)
+        keys = self._coverage_keys(df)
+        first_complete_date, coverage_pct = self._1_find_first_complete_coverage_date(df, allow_fallback, keys)
         if first_complete_date:
             self.logger.info(f"Completeness alignment will use {first_complete_date.strftime('%Y-%m-%d')} as starting reference (coverage: {coverage_pct:.1f}%)")
         
-        # Filter input data to start from optimal date before gap filling
+        # Filter input data to start from optimal date before gap filling (step 2 never writes into its input)
         if first_complete_date:
-            filtered_df = df[df['period_end_date'] >= first_complete_date].copy()
+            filtered_rows = self._rows_from_date(df, first_complete_date)
+            filtered_df = df.iloc[filtered_rows]
             removed_count = len(df) - len(filtered_df)
             if removed_count > 0:
                 self.logger.info(f"Removed {removed_count} records before optimal start date {first_complete_date.strftime('%Y-%m-%d')}")
@@ -248,12 +273,11 @@ class TimeSeriesAligner:
         
         # Step 2: Fill signature gaps after first complete date to ensure completeness
         report_coverage = (coverage_pct < 100.0)  # Report coverage issues when using fallback
-        complete_df = self._2_fill_signature_gaps_after_first_complete_date(filtered_df, first_complete_date, report_coverage)
+        complete_df = self._2_fill_signature_gaps_after_first_complete_date(filtered_df, first_complete_date, report_coverage, keys.take(filtered_rows))
         
         # Log basic completeness metrics and coverage reporting
         if not complete_df.empty:
-            signatures = complete_df.groupby(['set', 'type', 'period', 'name']).size()
-            total_signatures = len(signatures)
+            _, total_signatures = self._signature_codes(complete_df)
             unique_dates = len(complete_df['period_end_date'].unique())
             total_records = len(complete_df)
             expected_records = total_signatures * unique_dates
@@ -264,19 +288,16 @@ class TimeSeriesAligner:
             
             # Report coverage issues for dates that don't meet 100% coverage
             if report_coverage and completeness_pct < 100.0:
-                from collections import defaultdict
-                date_signature_count = defaultdict(int)
-                for _, row in complete_df.iterrows():
-                    date_signature_count[row['period_end_date']] += 1
-                
-                incomplete_dates = []
-                for date, count in date_signature_count.items():
-                    if count < total_signatures:
-                        coverage_pct = (count / total_signatures) * 100.0
-                        incomplete_dates.append(f"{date.strftime('%Y-%m-%d')}: {count}/{total_signatures} ({coverage_pct:.1f}%)")
+                # One counting pass over the date column (first-seen date order), then format only the dates shown
+                date_signature_count = complete_df['period_end_date'].value_counts(sort=False)
+                incomplete_counts = date_signature_count[date_signature_count < total_signatures]
+                incomplete_dates = [
+                    f"{date.strftime('%Y-%m-%d')}: {count}/{total_signatures} ({count / total_signatures * 100.0:.1f}%)"
+                    for date, count in incomplete_counts.iloc[:5].items()
+                ]
                 
                 if incomplete_dates:
-                    self.logger.warning(f"Dates with incomplete signature coverage: {', '.join(incomplete_dates[:5])}{'...' if len(incomplete_dates) > 5 else ''}")
+                    self.logger.warning(f"Dates with incomplete signature coverage: {', '.join(incomplete_dates)}{'...' if len(incomplete_counts) > 5 else ''}")
             
             self.logger.info("All signatures included without quality filtering")
         
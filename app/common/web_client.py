@@ -1,37 +1,116 @@
+import hashlib
+import json
 import requests
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
 
 from common.logger import AppLogger
 from common.helpers import RetryHelper
 
 
 class WebClient:
-    def __init__(self, timeout: int = 30, max_retries: int = 3, base_delay: float = 5.0):
+    def __init__(self, timeout: int = 30, max_retries: int = 3, base_delay: float = 5.0, pool_size: int = 10,
+                 cache_dir: Optional[Path] = None, cache_ttl: float = 3600.0):
         self.logger = AppLogger.get_logger(__name__)
         self.timeout = timeout
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.pool_size = pool_size
+        # One request slot schedule per client, shared by every thread that fetches through it
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # Optional on-disk response cache: fresh entries skip the network, stale ones are revalidated
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.session = requests.Session()
+        # Keep one pooled keep-alive connection per concurrent caller so TLS handshakes are reused across fetches
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'CSVProcessor/1.0'
         })
     
+    def _wait_for_request_slot(self) -> None:
+        """Block until this client's next request slot; slots are base_delay apart across all threads"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self.base_delay
+        time.sleep(slot - now)
+    
+    def fetch_many(self, urls: List[str], max_workers: int = 4) -> List[str]:
+        """Fetch URLs concurrently, returning contents in input order; requests still share this client's rate limit"""
+        # More workers than pooled connections would open throwaway connections that are never reused
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, self.pool_size))) as executor:
+            return list(executor.map(self.fetch, urls))
+    
+    def _cache_paths(self, url: str) -> Tuple[Path, Path]:
+        """Body and validator file paths for a URL in the cache directory"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.md", self.cache_dir / f"{key}.json"
+    
+    def _conditional_headers(self, meta_path: Path) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers from a cached response's validators"""
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def _store_cache(self, url: str, response: requests.Response) -> None:
+        """Write a response body and its validators to the cache directory"""
+        body_path, meta_path = self._cache_paths(url)
+        meta = {'url': url, 'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        for path, text in ((meta_path, json.dumps(meta)), (body_path, response.text)):
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(text, encoding='utf-8')
+            tmp_path.replace(path)
+    
     def fetch(self, url: str) -> str:
         self.logger.debug(f"Fetching URL: {url}")
         
+        body_path = meta_path = None
+        if self.cache_dir:
+            body_path, meta_path = self._cache_paths(url)
+            if body_path.exists() and time.time() - body_path.stat().st_mtime < self.cache_ttl:
+                self.logger.debug(f"Cache hit for {url}")
+                return body_path.read_text(encoding='utf-8')
+        
         @RetryHelper.with_exponential_backoff(self.max_retries, self.base_delay)
         def _fetch_with_retry():
-            # Always add base delay between requests to respect rate limits
-            time.sleep(self.base_delay)
-            response = self.session.get(url, timeout=self.timeout)
+            # Start each request at least base_delay after the previous one, across all threads, to respect rate limits
+            self._wait_for_request_slot()
+            headers = self._conditional_headers(meta_path) if body_path and body_path.exists() else {}
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
             
             # Handle rate limiting specifically
             if response.status_code == 429:
                 self.logger.warning("Rate limited (429), retrying...")
                 raise requests.exceptions.HTTPError("Rate limited", response=response)
             
+            # Cached copy is still current: refresh its age and reuse it; a 304 to an unconditional request has no body to serve
+            if response.status_code == 304:
+                if not (headers and body_path.exists()):
+                    raise requests.exceptions.HTTPError(f"Unexpected 304 Not Modified without a cached copy of {url}", response=response)
+                body_path.touch()
+                return body_path.read_text(encoding='utf-8')
+            
             response.raise_for_status()
+            # Only full 200 bodies are cached, so other 2xx responses are never served later as a fresh page
+            if self.cache_dir and response.status_code == 200:
+                self._store_cache(url, response)
             return response.text
         
         try:
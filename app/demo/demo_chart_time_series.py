@@ -5,8 +5,8 @@ This demonstrates how to use the plotChart function with actual time series data
 import sys
 import os
 
-# Add parent directory to path to import pyfxgit  
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add parent directory to path so we can import from common
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from common.helpers import ChartDataProcessor
 
 def demo_chart_factory(csv_file: str, title: str, save_name: str) -> bool:
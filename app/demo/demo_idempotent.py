@@ -4,31 +4,49 @@ Demo script showing idempotent functionality.
 """
 import sys
 import os
-import subprocess
+import logging
 from pathlib import Path
 
 # Add parent directory to path so we can import from common
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from common.logger import AppLogger
+from main import run
 
+APP_DIR = Path(__file__).resolve().parent.parent
+INPUT_FILE = APP_DIR / "data" / "input.csv"
+CACHE_DIR = APP_DIR / "demo" / ".http_cache"
 
-def run_command(cmd: str, description: str):
-    """Run a command and show its output"""
+
+class SummaryHandler(logging.Handler):
+    """Print the app's duplicate-detection summary lines as they are logged"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if 'duplicates' in message or 'total rows' in message or 'new)' in message:
+            print(f"📊 {message.strip()}")
+
+
+def run_app(output_file: Path, description: str):
+    """Run the app in-process and show its summary log lines"""
     print(f"\n🔄 {description}")
-    print(f"Command: {cmd}")
+    print(f"Command: main.run({INPUT_FILE.relative_to(APP_DIR)}, {output_file.name})")
     print("=" * 60)
     
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-    
-    # Show relevant log lines for duplicate detection
-    if result.stdout:
-        lines = result.stdout.split('\n')
-        for line in lines:
-            if 'duplicates' in line or 'total rows' in line or 'new)' in line:
-                print(f"📊 {line.strip()}")
-    
-    return result.returncode == 0
+    # Quiet the console while the app runs (it still logs to file) and echo only the summary lines
+    root_logger = logging.getLogger()
+    console_handlers = [handler for handler in root_logger.handlers if type(handler) is logging.StreamHandler]
+    console_levels = [handler.level for handler in console_handlers]
+    summary_handler = SummaryHandler(logging.INFO)
+    for handler in console_handlers:
+        handler.setLevel(logging.WARNING)
+    root_logger.addHandler(summary_handler)
+    try:
+        return run(INPUT_FILE, output_file, CACHE_DIR) == 0
+    finally:
+        root_logger.removeHandler(summary_handler)
+        for handler, level in zip(console_handlers, console_levels):
+            handler.setLevel(level)
 
 
 def main():
@@ -42,14 +60,14 @@ def main():
     print("without creating duplicate entries in the output file.\n")
     
     # Clean up any existing demo file
-    demo_file = Path("demo_idempotent.csv")
+    demo_file = Path(__file__).resolve().parent / "demo_idempotent.csv"
     if demo_file.exists():
         demo_file.unlink()
-        print(f"🧹 Cleaned up existing {demo_file}")
+        print(f"🧹 Cleaned up existing {demo_file.name}")
     
     # Run 1: First execution (should create 30 new records)
-    success1 = run_command(
-        "cd .. && PYTHONPATH=. pipenv run python3 main.py data/input.csv demo/demo_idempotent.csv",
+    success1 = run_app(
+        demo_file,
         "First Run - Creating new records"
     )
     
@@ -63,8 +81,8 @@ def main():
         print(f"✅ First run complete: {row_count} total lines (1 header + {row_count-1} data rows)")
     
     # Run 2: Second execution (should detect all as duplicates)
-    success2 = run_command(
-        "cd .. && PYTHONPATH=. pipenv run python3 main.py data/input.csv demo/demo_idempotent.csv",
+    success2 = run_app(
+        demo_file,
         "Second Run - Testing idempotency (should find duplicates)"
     )
     
@@ -84,8 +102,8 @@ def main():
             return 1
     
     # Run 3: Third execution (should still detect all as duplicates)
-    success3 = run_command(
-        "cd .. && PYTHONPATH=. pipenv run python3 main.py data/input.csv demo/demo_idempotent.csv",
+    success3 = run_app(
+        demo_file,
         "Third Run - Confirming idempotency"
     )
     
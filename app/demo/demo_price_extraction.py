@@ -4,6 +4,9 @@ Demo script showing TCGPlayer price history extraction functionality.
 """
 import sys
 import os
+import mmap
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path so we can import from common
@@ -14,95 +17,109 @@ from common.csv_writer import CsvWriter
 from common.logger import AppLogger
 import re
 
+# Price table patterns, compiled once per process: one scan finds the first table of either kind
+_TABLE_FLAGS = re.DOTALL | re.IGNORECASE
+_RE_PRICE_TABLE = re.compile(r'\|\s*Date\s*\|\s*(?P<kind>Holofoil|Normal)\s*\|.*?(?=\n\n|\n(?!\|)|\Z)', _TABLE_FLAGS)
+_RE_HOLOFOIL_TABLE = re.compile(r'\|\s*Date\s*\|\s*Holofoil\s*\|.*?(?=\n\n|\n(?!\|)|\Z)', _TABLE_FLAGS)
 
-def extract_price_table_flexible(content: str):
-    """Extract price table looking for both 'Date | Holofoil' and 'Date | Normal' formats"""
-    # Try original format first (Date | Holofoil)
-    holofoil_pattern = r'\|\s*Date\s*\|\s*Holofoil\s*\|.*?(?=\n\n|\n(?!\|)|\Z)'
-    match = re.search(holofoil_pattern, content, re.DOTALL | re.IGNORECASE)
+# Bytes twins of the patterns above, for scanning a memory-mapped response without decoding it
+_RE_PRICE_TABLE_BYTES = re.compile(_RE_PRICE_TABLE.pattern.encode(), _TABLE_FLAGS)
+_RE_HOLOFOIL_TABLE_BYTES = re.compile(_RE_HOLOFOIL_TABLE.pattern.encode(), _TABLE_FLAGS)
+
+
+def _table_text(match) -> str:
+    """Return a matched table as text, decoding only the matched slice of a bytes-like buffer"""
+    table = match.group(0)
+    return (table if isinstance(table, str) else table.decode('utf-8')).strip()
+
+
+def extract_price_table_flexible(content):
+    """Extract price table looking for both 'Date | Holofoil' and 'Date | Normal' formats
     
-    if match:
-        return match.group(0).strip(), 'holofoil'
+    content may be a str or a bytes-like buffer such as an mmap of the response file.
+    """
+    if isinstance(content, str):
+        price_table, holofoil_table = _RE_PRICE_TABLE, _RE_HOLOFOIL_TABLE
+    else:
+        price_table, holofoil_table = _RE_PRICE_TABLE_BYTES, _RE_HOLOFOIL_TABLE_BYTES
+    
+    match = price_table.search(content)
+    if not match:
+        return None, None
     
-    # Try alternative format (Date | Normal)
-    normal_pattern = r'\|\s*Date\s*\|\s*Normal\s*\|.*?(?=\n\n|\n(?!\|)|\Z)'
-    match = re.search(normal_pattern, content, re.DOTALL | re.IGNORECASE)
+    # Original format (Date | Holofoil) takes precedence
+    if match.group('kind').lower() in ('holofoil', b'holofoil'):
+        return _table_text(match), 'holofoil'
     
-    if match:
-        return match.group(0).strip(), 'normal'
+    # Alternative format (Date | Normal) came first; a later Holofoil table still wins, so only the rest is scanned
+    holofoil_match = holofoil_table.search(content, match.start() + 1)
+    if holofoil_match:
+        return _table_text(holofoil_match), 'holofoil'
     
-    return None, None
+    return _table_text(match), 'normal'
+
+
+def _map_response(f):
+    """Memory-map an open response file read-only; an empty file cannot be mapped and yields b''"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 def parse_price_data_flexible(table_content: str, table_type: str):
     """Parse price data from table content, handling both holofoil and normal formats"""
-    data_rows = []
-    lines = table_content.split('\n')
-    
-    # Skip header and separator lines
-    data_lines = [line.strip() for line in lines[2:] if line.strip() and line.strip().startswith('|')]
-    
-    for line in data_lines:
-        # Split by | and clean up
-        parts = [part.strip() for part in line.split('|')]
-        if len(parts) >= 4:  # | Date | Price | Volume |
-            date = parts[1].strip()
-            price = parts[2].strip()
-            volume = parts[3].strip() if len(parts) > 3 else ""
-            
-            # Create consistent format regardless of table type
-            row = {
-                'date': date,
-                'holofoil': price,  # Always use 'holofoil' key for consistency
-                'price': volume     # Volume goes in 'price' field for consistency
-            }
-            data_rows.append(row)
-    
-    return data_rows
+    # Skip header and separator lines; the rest is filtered and split in a single lazy pass
+    data_lines = (line.strip() for line in islice(table_content.split('\n'), 2, None))
+    
+    # Split by | at most four times: only | Date | Price | Volume | are kept, always under the
+    # 'holofoil' (price) and 'price' (volume) keys for consistency regardless of table type
+    # Price and volume cells repeat heavily across a table, so equal tokens are interned to share one str
+    rows = (line.split('|', 4) for line in data_lines if line.startswith('|'))
+    intern = sys.intern
+    return [
+        {'date': parts[1].strip(), 'holofoil': intern(parts[2].strip()), 'price': intern(parts[3].strip())}
+        for parts in rows if len(parts) >= 4
+    ]
 
 
 def main():
-    # Setup logging
-    logger = AppLogger()
-    logger.setup_logging(verbose=True, log_file="demo.log")
-    log = AppLogger.get_logger(__name__)
-    
-    log.info("Starting TCGPlayer price history extraction demo")
-    
-    # Get response file from command line argument or use default
+    # Get response file from command line argument or use default; checked before logging is
+    # configured so a bad path exits without creating or rotating any log file
     response_filename = sys.argv[1] if len(sys.argv) > 1 else "response_01.md"
     response_file = Path(response_filename)
     if not response_file.exists():
-        log.error(f"Response file '{response_file}' not found")
         print(f"Error: {response_file} not found in current directory")
         return 1
     
-    # Read the TCGPlayer response
-    log.info(f"Reading response from {response_file}")
-    with open(response_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    print(f"Read {len(content)} characters from {response_file}")
+    # Setup logging
+    logger = AppLogger()
+    logger.setup_logging(verbose=True, log_file="demo.log")
+    log = AppLogger.get_logger(__name__)
     
-    # Initialize parser
-    parser = MarkdownParser()
+    log.info("Starting TCGPlayer price history extraction demo")
     
-    # Extract price history table using flexible approach
-    print("\n1. Extracting price history table...")
-    table_content, table_type = extract_price_table_flexible(content)
+    # Map the TCGPlayer response; only the matched table is ever decoded
+    log.info(f"Reading response from {response_file}")
+    with open(response_file, 'rb') as f, _map_response(f) as content:
+        print(f"Read {len(content)} bytes from {response_file}")
+        
+        # Initialize parser
+        parser = MarkdownParser()
+        
+        # Extract price history table using flexible approach
+        print("\n1. Extracting price history table...")
+        table_content, table_type = extract_price_table_flexible(content)
     
     if table_content:
         print(f"✓ Successfully extracted table with {len(table_content.split())} lines")
         print(f"  Table format detected: 'Date | {table_type.title()}'")
         
-        # Show first few lines
+        # Show first few lines, written in one call
         lines = table_content.split('\n')
-        print("\nFirst 5 lines of extracted table:")
-        for i, line in enumerate(lines[:5]):
-            print(f"  {line}")
-        
+        preview = ["\nFirst 5 lines of extracted table:"] + [f"  {line}" for line in lines[:5]]
         if len(lines) > 5:
-            print(f"  ... and {len(lines) - 5} more lines")
+            preview.append(f"  ... and {len(lines) - 5} more lines")
+        sys.stdout.write('\n'.join(preview) + '\n')
     else:
         print("✗ No price history table found (tried both 'Date | Holofoil' and 'Date | Normal' formats)")
         return 1
@@ -114,13 +131,14 @@ def main():
     if data_rows:
         print(f"✓ Successfully parsed {len(data_rows)} data rows")
         
-        # Show first few rows
-        print("\nFirst 3 data rows:")
-        for i, row in enumerate(data_rows[:3]):
-            print(f"  Row {i+1}: Date='{row['date']}', Holofoil='{row['holofoil']}', Price='{row['price']}'")
-        
+        # Show first few rows, written in one call
+        preview = ["\nFirst 3 data rows:"] + [
+            f"  Row {i+1}: Date='{row['date']}', Holofoil='{row['holofoil']}', Price='{row['price']}'"
+            for i, row in enumerate(data_rows[:3])
+        ]
         if len(data_rows) > 3:
-            print(f"  ... and {len(data_rows) - 3} more rows")
+            preview.append(f"  ... and {len(data_rows) - 3} more rows")
+        sys.stdout.write('\n'.join(preview) + '\n')
     else:
         print("✗ No data rows parsed")
         return 1
@@ -129,18 +147,12 @@ def main():
     print("\n3. Writing to CSV file (normalized format)...")
     output_file = Path("demo_normalized_output.csv")
     
-    # Convert data format for CSV writer (normalized format like the app)
-    csv_data = []
-    for row in data_rows:
-        csv_data.append({
-            'set': 'SV08.5',  # Sample metadata
-            'type': 'Card',
-            'period': '3M', 
-            'name': 'Umbreon ex 161',
-            'date': row['date'],
-            'holofoil_price': row['holofoil'],
-            'additional_price': row['price']
-        })
+    # Convert data format for CSV writer (normalized format like the app); the sample metadata is shared by every row
+    metadata = {'set': 'SV08.5', 'type': 'Card', 'period': '3M', 'name': 'Umbreon ex 161'}
+    csv_data = [
+        {**metadata, 'date': row['date'], 'holofoil_price': row['holofoil'], 'additional_price': row['price']}
+        for row in data_rows
+    ]
     
     writer = CsvWriter()
     writer.write(csv_data, output_file)
@@ -152,22 +164,23 @@ def main():
         file_size = output_file.stat().st_size
         print(f"  Output file size: {file_size} bytes")
         
-        # Show first few lines of CSV
+        # Show first few lines of CSV; the header plus one line per row is already known, so only those few are read back
+        csv_line_count = len(csv_data) + 1
         with open(output_file, 'r') as f:
-            csv_lines = f.readlines()
-        print(f"\nFirst 4 lines of CSV output:")
-        for i, line in enumerate(csv_lines[:4]):
-            print(f"  {line.strip()}")
-        
-        if len(csv_lines) > 4:
-            print(f"  ... and {len(csv_lines) - 4} more lines")
+            csv_lines = list(islice(f, 4))
+        preview = ["\nFirst 4 lines of CSV output:"] + [f"  {line.strip()}" for line in csv_lines]
+        if csv_line_count > 4:
+            preview.append(f"  ... and {csv_line_count - 4} more lines")
+        sys.stdout.write('\n'.join(preview) + '\n')
     
     log.info("Demo completed successfully")
-    print(f"\n✓ Demo completed successfully!")
-    print(f"  - Extracted table: {len(table_content)} characters")
-    print(f"  - Parsed data: {len(data_rows)} rows") 
-    print(f"  - Normalized CSV output: demo/{output_file}")
-    print(f"  - Format: Each price record as separate row with metadata")
+    sys.stdout.write('\n'.join([
+        "\n✓ Demo completed successfully!",
+        f"  - Extracted table: {len(table_content)} characters",
+        f"  - Parsed data: {len(data_rows)} rows",
+        f"  - Normalized CSV output: demo/{output_file}",
+        "  - Format: Each price record as separate row with metadata",
+    ]) + '\n')
     
     return 0
 
@@ -36,9 +36,13 @@ def main():
     print(f"📊 Subset created: {len(subset_df)} records")
     
     if not subset_df.empty:
-        print(f"   Sets: {sorted(subset_df['set'].unique())}")
-        print(f"   Products: {subset_df['name'].nunique()} unique products")
-        print(f"   Date range: {len(subset_df['period_end_date'].unique())} common periods")
+        # Distinct sets are deduplicated and sorted within pandas; the counts need no intermediate unique arrays
+        sets_sorted = subset_df['set'].drop_duplicates().sort_values().tolist()
+        sys.stdout.write('\n'.join([
+            f"   Sets: {sets_sorted}",
+            f"   Products: {subset_df['name'].nunique()} unique products",
+            f"   Date range: {subset_df['period_end_date'].nunique(dropna=False)} common periods",
+        ]) + '\n')
     else:
         print("   No data matches the filters or alignment requirements - exiting")
         return
@@ -48,21 +52,23 @@ def main():
     # Aggregate into time series
     ts_df = aggregator.aggregate_time_series(subset_df, "SV_Box_Demo")
 
-    print(f"✅ Time series created: {len(ts_df)} data points")
-    print("\nTime Series Preview:")
-    print("=" * 75)
-    print(f"{'Name':<12} {'Date':<12} {'Avg Price':<12} {'Avg Value':<12}")
-    print("-" * 75)
-
-    for _, row in ts_df.head().iterrows():
-        date_str = row['period_end_date'].strftime('%Y-%m-%d')
-        price = row['aggregate_price']
-        value = row['aggregate_value']
-        name = row['name']
-        print(f"{name:<12} {date_str:<12} ${price:<11.2f} ${value:<11.2f}")
-
-    print("=" * 75)
-    print(f"Total periods: {len(ts_df)}")
+    # Collect the preview and write it in one call instead of one print per line
+    preview = [
+        f"✅ Time series created: {len(ts_df)} data points",
+        "\nTime Series Preview:",
+        "=" * 75,
+        f"{'Name':<12} {'Date':<12} {'Avg Price':<12} {'Avg Value':<12}",
+        "-" * 75,
+    ]
+
+    # itertuples yields plain tuples with native column dtypes instead of building a Series per row
+    columns = ['name', 'period_end_date', 'aggregate_price', 'aggregate_value']
+    for name, period_end_date, price, value in ts_df.head()[columns].itertuples(index=False, name=None):
+        date_str = period_end_date.strftime('%Y-%m-%d')
+        preview.append(f"{name:<12} {date_str:<12} ${price:<11.2f} ${value:<11.2f}")
+
+    preview += ["=" * 75, f"Total periods: {len(ts_df)}"]
+    sys.stdout.write('\n'.join(preview) + '\n')
 
     # Save the time series
     output_file = Path('data/SV_Box_Demo_time_series.csv')
@@ -3,6 +3,7 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 from common.processor import CsvProcessor
 from common.csv_writer import CsvWriter
@@ -11,34 +12,43 @@ from common.logger import AppLogger
 
 
 
-def main() -> None:
-    """Main entry point with one-liner argument setup"""
-    parser = argparse.ArgumentParser(description='Process CSV data with web requests and markdown parsing')
-    # One-liner argument configuration
-    args_config = [('input_file', {'type': Path, 'help': 'Input CSV file path'}), ('output_file', {'type': Path, 'help': 'Output CSV file path'}), ('--verbose', {'action': 'store_true', 'help': 'Enable verbose output'}), ('-v', {'action': 'store_true', 'dest': 'verbose', 'help': 'Enable verbose output (short form)'})]
-    [parser.add_argument(name, **kwargs) for name, kwargs in args_config]
-    
-    args = parser.parse_args()
-    
-    # One-liner logging setup and file validation
-    app_logger = AppLogger()
-    app_logger.setup_logging(verbose=args.verbose, log_file="app.log")
+def run(input_file: Path, output_file: Path, cache_dir: Optional[Path] = None) -> int:
+    """Process input_file into output_file in-process, returning the CLI exit code"""
     logger = AppLogger.get_logger(__name__)
     
-    if not args.input_file.exists():
-        logger.error(f"Input file '{args.input_file}' does not exist")
-        sys.exit(1)
+    if not input_file.exists():
+        logger.error(f"Input file '{input_file}' does not exist")
+        return 1
     
     # One-liner processing workflow
-    processor, writer = CsvProcessor(), CsvWriter()
+    processor, writer = CsvProcessor(cache_dir=cache_dir), CsvWriter()
     
     try:
-        results = processor.process(args.input_file)
-        writer.write_unique(results, args.output_file)
-        logger.info(f"Processing complete. Output saved to: {args.output_file}")
+        results = processor.process(input_file)
+        writer.write_unique(results, output_file)
+        logger.info(f"Processing complete. Output saved to: {output_file}")
+        return 0
     except Exception as e:
         logger.error(f"Processing failed: {e}")
-        sys.exit(1)
+        return 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point with one-liner argument setup; argv defaults to sys.argv[1:]"""
+    parser = argparse.ArgumentParser(prog='main.py', description='Process CSV data with web requests and markdown parsing')
+    # One-liner argument configuration
+    args_config = [('input_file', {'type': Path, 'help': 'Input CSV file path'}), ('output_file', {'type': Path, 'help': 'Output CSV file path'}), ('--verbose', {'action': 'store_true', 'help': 'Enable verbose output'}), ('-v', {'action': 'store_true', 'dest': 'verbose', 'help': 'Enable verbose output (short form)'}), ('--cache-dir', {'type': Path, 'default': None, 'help': 'Cache fetched pages in this directory so re-runs skip the network'})]
+    [parser.add_argument(name, **kwargs) for name, kwargs in args_config]
+    
+    args = parser.parse_args(argv)
+    
+    # One-liner logging setup
+    app_logger = AppLogger()
+    app_logger.setup_logging(verbose=args.verbose, log_file="app.log")
+    
+    exit_code = run(args.input_file, args.output_file, args.cache_dir)
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -109,12 +109,10 @@ class TestConfigurationFactory:
             description="Test description", updating_existing=False, existing_usage=None
         )
         
-        assert all([
-            entry["name"] == "test_config",
-            entry["filters"] == sample_filter_config,
-            entry["usage_statistics"]["use_count"] == 0,
-            entry["usage_statistics"]["last_used"] is None
-        ])
+        assert (entry["name"] == "test_config"
+                and entry["filters"] == sample_filter_config
+                and entry["usage_statistics"]["use_count"] == 0
+                and entry["usage_statistics"]["last_used"] is None)
 
     def test_create_config_entry_updating_existing(self, sample_filter_config, sample_validation_metadata, existing_usage_stats):
         """Test updating existing configuration preserves usage statistics"""
@@ -156,6 +154,14 @@ class TestConfigurationManagerHelper:
         
         assert "last_validation" in updated["usage_statistics"] and updated["usage_statistics"]["last_validation"] != "2025-07-29T10:00:00Z"
 
+    def test_update_usage_stats_shared_timestamp(self):
+        """Test updating usage statistics with a caller-supplied batch timestamp"""
+        now = "2025-08-01T12:00:00+00:00"
+        configs = [{"usage_statistics": {"last_used": None, "use_count": 0}} for _ in range(3)]
+        updated = [ConfigurationManagerHelper.update_usage_stats(config, "use", now) for config in configs]
+
+        assert all(config["usage_statistics"]["last_used"] == now for config in updated)
+
     def test_validate_and_log_success(self):
         """Test validation with successful result"""
         logger, validation_func = Mock(), lambda: (True, [])
@@ -291,6 +297,13 @@ class TestConfigurationManager:
         invalid_names = ["invalid name", "invalid@name", "", "a" * 51]
         assert all(not config_manager.validate_configuration_name(name)[0] for name in invalid_names)
 
+    def test_validate_configuration_name_does_not_read_config_file(self, config_manager):
+        """Test name validation is a pure format check that never loads the configurations file"""
+        with patch.object(config_manager, '_load_configurations_file') as mock_load:
+            assert config_manager.validate_configuration_name("valid_name") == (True, [])
+        
+        mock_load.assert_not_called()
+
     def test_validate_filter_format_valid(self, config_manager):
         """Test validating valid filter formats"""
         valid_filters = [
@@ -1,25 +1,44 @@
+import csv
+import io
+import logging
 import os
 import pytest
-import tempfile
-from pathlib import Path
+import tracemalloc
+from contextlib import redirect_stdout, redirect_stderr
+from types import MappingProxyType
 from typing import List, Dict
-from unittest.mock import Mock
 
+import requests.exceptions
 import requests_mock
-# Using subprocess for CLI testing instead of typer
-import subprocess
 
 from common.processor import CsvProcessor
 from common.web_client import WebClient
 from common.markdown_parser import MarkdownParser
 from common.csv_writer import CsvWriter
 from common.logger import AppLogger
+from common.configuration_manager import ConfigurationManager
+from common.coverage_analyzer import CoverageResult, RecommendationResult
+from common.time_series_aligner import TimeSeriesAligner
+from chart.index_aggregator import IndexAggregator, FilterValidator
 
 
-SAMPLE_CSV = """set,type,period,name,url
-SV08.5,Card,3M,Umbreon ex 161,https://r.jina.ai/https://www.tcgplayer.com/product/610516/pokemon-sv-prismatic-evolutions-umbreon-ex-161-131?page=1&Language=English
-SV08,Card,3M,Pikachu ex 238,https://r.jina.ai/https://www.tcgplayer.com/product/590027/pokemon-sv08-surging-sparks-pikachu-ex-238-191?page=1&Language=English
-SV07,Card,3M,Squirtle 148,https://r.jina.ai/https://www.tcgplayer.com/product/567429/pokemon-sv07-stellar-crown-squirtle?page=1&Language=English"""
+# Sample TCGPlayer product URLs, defined once and shared by SAMPLE_CSV and the fixtures below
+URL_UMBREON = "https://r.jina.ai/https://www.tcgplayer.com/product/610516/pokemon-sv-prismatic-evolutions-umbreon-ex-161-131?page=1&Language=English"
+URL_PIKACHU = "https://r.jina.ai/https://www.tcgplayer.com/product/590027/pokemon-sv08-surging-sparks-pikachu-ex-238-191?page=1&Language=English"
+URL_SQUIRTLE = "https://r.jina.ai/https://www.tcgplayer.com/product/567429/pokemon-sv07-stellar-crown-squirtle?page=1&Language=English"
+
+# Standard timestamp for test data consistency
+DEFAULT_TIMESTAMP = '2025-07-24 15:00:00'
+
+# Filter configurations; fixtures hand out dict copies because configs are saved to JSON and deep-copied by asdict
+SV_CARD_FILTER = MappingProxyType({"sets": "SV*", "types": "Card", "period": "3M"})
+MIXED_GENERATION_FILTER = MappingProxyType({"sets": "SWSH*,SV*", "types": "Card", "period": "3M"})
+INVALID_FILTER = MappingProxyType({"sets": "invalid", "types": "invalid", "period": "3M"})
+
+SAMPLE_CSV = f"""set,type,period,name,url
+SV08.5,Card,3M,Umbreon ex 161,{URL_UMBREON}
+SV08,Card,3M,Pikachu ex 238,{URL_PIKACHU}
+SV07,Card,3M,Squirtle 148,{URL_SQUIRTLE}"""
 
 SAMPLE_MARKDOWN = """# Test Document
 
@@ -39,6 +58,10 @@ print("Hello World")
 
 Some regular text at the end."""
 
+# Encoded once; the mock transport serves this shared bytes object instead of re-encoding SAMPLE_MARKDOWN per request
+SAMPLE_MARKDOWN_BYTES = SAMPLE_MARKDOWN.encode("utf-8")
+MARKDOWN_HEADERS = MappingProxyType({"Content-Type": "text/markdown; charset=utf-8"})
+
 SAMPLE_OUTPUT_CSV = """url,name,content
 https://example.com/test1.md,Test Document 1,"Test Document
 
@@ -58,44 +81,144 @@ https://example.com/test3.md,Test Document 3,""
 """
 
 
-@pytest.fixture
-def sample_csv_file():
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(SAMPLE_CSV)
-        f.flush()
-        yield Path(f.name)
-    os.remove(f.name)
+def _frozen(record: Dict) -> MappingProxyType:
+    """Read-only view of a session-scoped record, so a test that mutates shared data fails loudly"""
+    return MappingProxyType(record)
 
 
-@pytest.fixture
-def sample_output_file():
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.flush()
-        yield Path(f.name)
-    if os.path.exists(f.name):
-        os.remove(f.name)
+def _frozen_rows(rows: List[Dict]) -> tuple:
+    """Read-only rows for session-scoped list fixtures"""
+    return tuple(map(_frozen, rows))
+
+
+class MockResult:
+    """Outcome of one TestRunner.invoke call"""
+
+    def __init__(self, exit_code, stdout, stderr):
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+class TestRunner:
+    """Runs a CLI entry point in-process with the given args and captured stdout/stderr"""
+    __test__ = False
+
+    def __init__(self):
+        self._stdout = io.StringIO()
+        self._stderr = io.StringIO()
+
+    def invoke(self, main_func, args):
+        """Mock invoke method for testing CLI commands"""
+        # Reuse the capture buffers; each result keeps its own copy of the text
+        for capture in (self._stdout, self._stderr):
+            capture.seek(0)
+            capture.truncate()
+
+        # Pass args straight to the entry point so sys.argv is never touched
+        try:
+            with redirect_stdout(self._stdout), redirect_stderr(self._stderr):
+                main_func(args)
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code
+        except Exception as e:
+            self._stderr.write(str(e))
+            exit_code = 1
+
+        return MockResult(exit_code, self._stdout.getvalue(), self._stderr.getvalue())
+
+
+# Leak guard limits for --leak-check; setup_logging replaces the root handlers, so any steady growth is a leak
+LEAK_MAX_ROOT_HANDLERS = 8
+LEAK_MAX_NEW_FDS = 16
+LEAK_MAX_NEW_BYTES = 64 * 1024 * 1024
+
+
+def pytest_addoption(parser):
+    parser.addoption("--leak-check", action="store_true", default=False,
+                     help="Fail the session if root logger handlers, open file descriptors or traced memory grow past the leak limits")
+
+
+def _open_fd_count() -> int:
+    """Open file descriptors of this process, or 0 where /proc is unavailable"""
+    try:
+        return len(os.listdir('/proc/self/fd'))
+    except OSError:
+        return 0
+
+
+def _leak_report(handlers: int, new_fds: int, new_bytes: int) -> List[str]:
+    """Messages for every leak limit exceeded; empty when the session is clean"""
+    checks = [
+        (handlers > LEAK_MAX_ROOT_HANDLERS, f"root logger has {handlers} handlers (limit {LEAK_MAX_ROOT_HANDLERS})"),
+        (new_fds > LEAK_MAX_NEW_FDS, f"{new_fds} file descriptors opened and not closed (limit {LEAK_MAX_NEW_FDS})"),
+        (new_bytes > LEAK_MAX_NEW_BYTES, f"{new_bytes / 2**20:.1f} MiB of traced memory retained (limit {LEAK_MAX_NEW_BYTES / 2**20:.0f} MiB)"),
+    ]
+    return [message for exceeded, message in checks if exceeded]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def leak_guard(request):
+    """Opt-in (--leak-check) session guard against fixtures leaking log handlers, file descriptors or memory"""
+    if not request.config.getoption("--leak-check"):
+        yield
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    fds_before = _open_fd_count()
+    bytes_before = tracemalloc.get_traced_memory()[0]
+
+    yield
+
+    problems = _leak_report(len(logging.getLogger().handlers),
+                            _open_fd_count() - fds_before,
+                            tracemalloc.get_traced_memory()[0] - bytes_before)
+    if started_tracing:
+        tracemalloc.stop()
+    if problems:
+        pytest.fail("Leak check failed: " + "; ".join(problems), pytrace=False)
+
+
+# Parsed from SAMPLE_CSV itself so the row fixtures cannot drift from the sample file contents
+_SAMPLE_ROWS = _frozen_rows(list(csv.DictReader(io.StringIO(SAMPLE_CSV))))
+
+
+@pytest.fixture(scope="session")
+def sample_csv_file(tmp_path_factory):
+    """SAMPLE_CSV written once per session; tests only read it"""
+    path = tmp_path_factory.mktemp("csv") / "sample.csv"
+    path.write_text(SAMPLE_CSV)
+    return path
 
 
 @pytest.fixture
+def sample_output_file(tmp_path):
+    """Empty output file in the test's own tmp_path, cleaned up by pytest"""
+    path = tmp_path / "output.csv"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
 def sample_markdown_content():
     return SAMPLE_MARKDOWN
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_data():
-    return [
-        {'set': 'SV08.5', 'type': 'Card', 'period': '3M', 'name': 'Umbreon ex 161', 'url': 'https://r.jina.ai/https://www.tcgplayer.com/product/610516/pokemon-sv-prismatic-evolutions-umbreon-ex-161-131?page=1&Language=English'},
-        {'set': 'SV08', 'type': 'Card', 'period': '3M', 'name': 'Pikachu ex 238', 'url': 'https://r.jina.ai/https://www.tcgplayer.com/product/590027/pokemon-sv08-surging-sparks-pikachu-ex-238-191?page=1&Language=English'},
-        {'set': 'SV07', 'type': 'Card', 'period': '3M', 'name': 'Squirtle 148', 'url': 'https://r.jina.ai/https://www.tcgplayer.com/product/567429/pokemon-sv07-stellar-crown-squirtle?page=1&Language=English'}
-    ]
+    """SAMPLE_CSV rows as the processor reads them, parsed once at import"""
+    return _SAMPLE_ROWS
 
 
 # V2.0 Schema Test Data Fixtures
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_v2_card_data():
     """Sample TCGPlayer card data in v2.0 format"""
-    return [
+    return _frozen_rows([
         {
             'set': 'SV08.5',
             'type': 'Card',
@@ -103,7 +226,7 @@ def sample_v2_card_data():
             'name': 'Test Card',
             'period_start_date': '2025-01-01',
             'period_end_date': '2025-01-03',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 100.00,
             'volume': 0
         },
@@ -114,7 +237,7 @@ def sample_v2_card_data():
             'name': 'Test Card',
             'period_start_date': '2025-01-04',
             'period_end_date': '2025-01-06',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 105.00,
             'volume': 1
         },
@@ -125,149 +248,133 @@ def sample_v2_card_data():
             'name': 'Test Card',
             'period_start_date': '2025-01-07',
             'period_end_date': '2025-01-09',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 110.00,
             'volume': 2
         }
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_v2_price_history():
     """Sample price history data in v2.0 format for TCGPlayer tests"""
-    return [
+    return _frozen_rows([
         {
             'period_start_date': '2025-07-16',
             'period_end_date': '2025-07-18',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 1200.00,
             'volume': 0
         },
         {
             'period_start_date': '2025-07-13',
             'period_end_date': '2025-07-15',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 1150.00,
             'volume': 1
         },
         {
             'period_start_date': '2025-07-10',
             'period_end_date': '2025-07-12',
-            'timestamp': '2025-07-24 15:00:00',
+            'timestamp': DEFAULT_TIMESTAMP,
             'holofoil_price': 1100.00,
             'volume': 2
         }
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_v2_single_record():
     """Single v2.0 format record for testing"""
-    return {
+    return _frozen({
         'set': 'SV08.5',
         'type': 'Card',
         'period': '3M',
         'name': 'Test Card',
         'period_start_date': '2025-01-01',
         'period_end_date': '2025-01-03',
-        'timestamp': '2025-07-24 15:00:00',
+        'timestamp': DEFAULT_TIMESTAMP,
         'holofoil_price': 100.00,
         'volume': 0
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tcg_url_data():
     """Sample data with real TCGPlayer URL for processor tests"""
-    return [{
+    return _frozen_rows([{
         'set': 'SV08.5',
         'type': 'Card',
         'period': '3M',
         'name': 'Umbreon ex 161',
-        'url': 'https://r.jina.ai/https://www.tcgplayer.com/product/610516/pokemon-sv-prismatic-evolutions-umbreon-ex-161-131?page=1&Language=English'
-    }]
+        'url': URL_UMBREON
+    }])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_timestamp():
     """Standard timestamp for test data consistency"""
-    return '2025-07-24 15:00:00'
+    return DEFAULT_TIMESTAMP
+
+
+@pytest.fixture(scope="session")
+def test_logging():
+    """Initialize logging for tests once; setup_logging restarts its handlers and listener on every call.
+
+    File records go to os.devnull (an absolute log_file replaces the logs/ directory) so the
+    fixture adds no disk writes; console output is unchanged.
+    """
+    AppLogger().setup_logging(verbose=True, log_file=os.devnull)
 
 
 @pytest.fixture
-def csv_processor():
-    # Initialize logging for tests
-    logger = AppLogger()
-    logger.setup_logging(verbose=True, log_file="test.log")
+def csv_processor(test_logging):
+    # Fresh per test: tests swap in mock collaborators and change max_workers
     return CsvProcessor()
 
 
 @pytest.fixture
 def web_client():
+    # Fresh per test: holds an HTTP session and rate-limiter state
     return WebClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def markdown_parser():
     return MarkdownParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csv_writer():
     return CsvWriter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Simple test runner using subprocess for CLI testing"""
-    class TestRunner:
-        def invoke(self, main_func, args):
-            """Mock invoke method for testing CLI commands"""
-            import sys
-            import io
-            from contextlib import redirect_stdout, redirect_stderr
-
-            # Capture stdout and stderr
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
-
-            # Mock sys.argv
-            original_argv = sys.argv
-            sys.argv = ['main.py'] + args
-
-            try:
-                with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                    main_func()
-                exit_code = 0
-            except SystemExit as e:
-                exit_code = e.code
-            except Exception as e:
-                stderr_capture.write(str(e))
-                exit_code = 1
-            finally:
-                sys.argv = original_argv
-
-            # Create mock result
-            class MockResult:
-                def __init__(self, exit_code, stdout, stderr):
-                    self.exit_code = exit_code
-                    self.stdout = stdout
-                    self.stderr = stderr
-
-            return MockResult(exit_code, stdout_capture.getvalue(), stderr_capture.getvalue())
-
+    """In-process runner for CLI testing, shared by every test"""
     return TestRunner()
 
 
+@pytest.fixture(scope="session")
+def _mock_requests_adapter():
+    """requests_mock adapter with the TCGPlayer URL responses registered once per session"""
+    adapter = requests_mock.Adapter()
+    # Mock TCGPlayer URLs with sample content
+    adapter.register_uri('GET', URL_UMBREON, content=SAMPLE_MARKDOWN_BYTES, headers=dict(MARKDOWN_HEADERS))
+    adapter.register_uri('GET', URL_PIKACHU, status_code=404)
+    adapter.register_uri('GET', URL_SQUIRTLE, exc=requests.exceptions.ConnectTimeout)
+    return adapter
+
+
 @pytest.fixture
-def mock_requests():
-    import requests.exceptions
-    with requests_mock.Mocker() as m:
-        # Mock TCGPlayer URLs with sample content
-        m.get('https://r.jina.ai/https://www.tcgplayer.com/product/610516/pokemon-sv-prismatic-evolutions-umbreon-ex-161-131?page=1&Language=English', text=SAMPLE_MARKDOWN)
-        m.get('https://r.jina.ai/https://www.tcgplayer.com/product/590027/pokemon-sv08-surging-sparks-pikachu-ex-238-191?page=1&Language=English', status_code=404)
-        m.get('https://r.jina.ai/https://www.tcgplayer.com/product/567429/pokemon-sv07-stellar-crown-squirtle?page=1&Language=English', exc=requests.exceptions.ConnectTimeout())
+def mock_requests(_mock_requests_adapter):
+    """Patch requests for one test with the shared adapter; request history is cleared afterwards.
+
+    Only the registrations are shared, so tests must not register extra URLs on the yielded mocker.
+    """
+    with requests_mock.Mocker(adapter=_mock_requests_adapter) as m:
         yield m
+    _mock_requests_adapter.reset()
 
 
 # Coverage Analyzer Test Fixtures
@@ -275,32 +382,29 @@ def mock_requests():
 @pytest.fixture
 def sv_card_filter_config():
     """Standard SV* Card filter configuration"""
-    return {"sets": "SV*", "types": "Card", "period": "3M"}
+    return dict(SV_CARD_FILTER)
 
 
 # Configuration Manager Test Fixtures
 
 @pytest.fixture
-def config_temp_file():
-    """Temporary configuration file for ConfigurationManager tests"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        temp_path = Path(f.name)
-    yield temp_path
-    if temp_path.exists():
-        temp_path.unlink()
+def config_temp_file(tmp_path):
+    """Empty configuration file for ConfigurationManager tests, removed with tmp_path"""
+    temp_path = tmp_path / "config.json"
+    temp_path.touch()
+    return temp_path
 
 
 @pytest.fixture
 def config_manager(config_temp_file):
     """ConfigurationManager instance with temporary file"""
-    from common.configuration_manager import ConfigurationManager
     return ConfigurationManager(config_temp_file)
 
 
 @pytest.fixture
 def sample_filter_config():
     """Sample filter configuration for testing"""
-    return {"sets": "SV*", "types": "Card", "period": "3M"}
+    return dict(SV_CARD_FILTER)
 
 
 @pytest.fixture
@@ -329,19 +433,18 @@ def existing_usage_stats():
 @pytest.fixture
 def mixed_generation_filter_config():
     """Mixed generation filter configuration for failure scenarios"""
-    return {"sets": "SWSH*,SV*", "types": "Card", "period": "3M"}
+    return dict(MIXED_GENERATION_FILTER)
 
 
 @pytest.fixture
 def invalid_filter_config():
     """Invalid filter configuration for testing edge cases"""
-    return {"sets": "invalid", "types": "invalid", "period": "3M"}
+    return dict(INVALID_FILTER)
 
 
-@pytest.fixture
-def successful_coverage_result_data():
-    """Complete coverage result data (100% success scenario)"""
-    return {
+# Coverage result scenarios, built once at import and looked up by the named fixtures below (read-only: tuples, not lists)
+_COVERAGE_RESULT_DATA = MappingProxyType({
+    "successful": _frozen({
         "coverage_percentage": 1.0,
         "signatures_found": 13,
         "signatures_total": 13,
@@ -350,16 +453,11 @@ def successful_coverage_result_data():
         "records_aligned": 1209,
         "time_series_points": 93,
         "gap_fills_required": 50,
-        "missing_signatures": [],
+        "missing_signatures": (),
         "fallback_required": False,
         "quality_score": 1.0
-    }
-
-
-@pytest.fixture
-def failed_coverage_result_data():
-    """Failed coverage result data (0% coverage scenario)"""
-    return {
+    }),
+    "failed": _frozen({
         "coverage_percentage": 0.0,
         "signatures_found": 0,
         "signatures_total": 20,
@@ -368,16 +466,11 @@ def failed_coverage_result_data():
         "records_aligned": 0,
         "time_series_points": 0,
         "gap_fills_required": 0,
-        "missing_signatures": ["SWSH06_Charizard_Card", "SV01_Pikachu_Card"],
+        "missing_signatures": ("SWSH06_Charizard_Card", "SV01_Pikachu_Card"),
         "fallback_required": False,
         "quality_score": 0.0
-    }
-
-
-@pytest.fixture
-def partial_coverage_result_data():
-    """Partial coverage result data (95% with fallback scenario)"""
-    return {
+    }),
+    "partial": _frozen({
         "coverage_percentage": 0.95,
         "signatures_found": 19,
         "signatures_total": 20,
@@ -386,16 +479,11 @@ def partial_coverage_result_data():
         "records_aligned": 1859,
         "time_series_points": 93,
         "gap_fills_required": 212,
-        "missing_signatures": ["SWSH06_Charizard_Card"],
+        "missing_signatures": ("SWSH06_Charizard_Card",),
         "fallback_required": True,
         "quality_score": 0.85
-    }
-
-
-@pytest.fixture
-def standard_coverage_result_data():
-    """Standard coverage result data for general testing"""
-    return {
+    }),
+    "standard": _frozen({
         "coverage_percentage": 0.9,
         "signatures_found": 10,
         "signatures_total": 11,
@@ -404,16 +492,11 @@ def standard_coverage_result_data():
         "records_aligned": 1000,
         "time_series_points": 90,
         "gap_fills_required": 25,
-        "missing_signatures": ["SV10_Missing_Card"],
+        "missing_signatures": ("SV10_Missing_Card",),
         "fallback_required": False,
         "quality_score": 0.88
-    }
-
-
-@pytest.fixture
-def alternative_suggestion_result_data():
-    """Coverage result data for alternative suggestion scenarios"""
-    return {
+    }),
+    "alternative": _frozen({
         "coverage_percentage": 0.92,
         "signatures_found": 12,
         "signatures_total": 13,
@@ -422,56 +505,79 @@ def alternative_suggestion_result_data():
         "records_aligned": 1156,
         "time_series_points": 93,
         "gap_fills_required": 74,
-        "missing_signatures": ["SV10_MissingCard_Card"],
+        "missing_signatures": ("SV10_MissingCard_Card",),
         "fallback_required": False,
         "quality_score": 0.89
-    }
+    }),
+})
 
 
-@pytest.fixture
-def successful_coverage_result(sv_card_filter_config, successful_coverage_result_data):
-    """Complete CoverageResult fixture for successful analysis"""
-    from common.coverage_analyzer import CoverageResult
+def _coverage_result(filter_config, scenario: str) -> CoverageResult:
+    """CoverageResult for a table scenario; CoverageResult is only shallowly frozen, so each gets its own dict and list"""
+    data = _COVERAGE_RESULT_DATA[scenario]
     return CoverageResult(
-        filter_config=sv_card_filter_config,
-        **successful_coverage_result_data
+        filter_config=dict(filter_config),
+        **{**data, "missing_signatures": list(data["missing_signatures"])}
     )
 
 
+@pytest.fixture(scope="session")
+def successful_coverage_result_data():
+    """Complete coverage result data (100% success scenario)"""
+    return _COVERAGE_RESULT_DATA["successful"]
+
+
+@pytest.fixture(scope="session")
+def failed_coverage_result_data():
+    """Failed coverage result data (0% coverage scenario)"""
+    return _COVERAGE_RESULT_DATA["failed"]
+
+
+@pytest.fixture(scope="session")
+def partial_coverage_result_data():
+    """Partial coverage result data (95% with fallback scenario)"""
+    return _COVERAGE_RESULT_DATA["partial"]
+
+
+@pytest.fixture(scope="session")
+def standard_coverage_result_data():
+    """Standard coverage result data for general testing"""
+    return _COVERAGE_RESULT_DATA["standard"]
+
+
+@pytest.fixture
+def successful_coverage_result():
+    """Complete CoverageResult fixture for successful analysis"""
+    return _coverage_result(SV_CARD_FILTER, "successful")
+
+
 @pytest.fixture
-def failed_coverage_result(mixed_generation_filter_config, failed_coverage_result_data):
+def failed_coverage_result():
     """Complete CoverageResult fixture for failed analysis"""
-    from common.coverage_analyzer import CoverageResult
-    return CoverageResult(
-        filter_config=mixed_generation_filter_config,
-        **failed_coverage_result_data
-    )
+    return _coverage_result(MIXED_GENERATION_FILTER, "failed")
 
 
 @pytest.fixture
-def partial_coverage_result(mixed_generation_filter_config, partial_coverage_result_data):
+def partial_coverage_result():
     """Complete CoverageResult fixture for partial coverage analysis"""
-    from common.coverage_analyzer import CoverageResult
-    return CoverageResult(
-        filter_config=mixed_generation_filter_config,
-        **partial_coverage_result_data
-    )
+    return _coverage_result(MIXED_GENERATION_FILTER, "partial")
 
 
 @pytest.fixture
-def standard_coverage_result(sv_card_filter_config, standard_coverage_result_data):
+def standard_coverage_result():
     """Complete CoverageResult fixture for standard testing"""
-    from common.coverage_analyzer import CoverageResult
-    return CoverageResult(
-        filter_config=sv_card_filter_config,
-        **standard_coverage_result_data
-    )
+    return _coverage_result(SV_CARD_FILTER, "standard")
+
+
+@pytest.fixture
+def alternative_coverage_result():
+    """Complete CoverageResult fixture for an alternative suggested after a failed filter"""
+    return _coverage_result(SV_CARD_FILTER, "alternative")
 
 
 @pytest.fixture
 def successful_recommendation_result(sv_card_filter_config, successful_coverage_result):
-    """Complete RecommendationResult fixture for successful recommendation"""
-    from common.coverage_analyzer import RecommendationResult
+    """Complete RecommendationResult fixture for successful recommendation (per test: rank is reassigned when ranking)"""
     return RecommendationResult(
         rank=1,
         filter_config=sv_card_filter_config,
@@ -485,7 +591,6 @@ def successful_recommendation_result(sv_card_filter_config, successful_coverage_
 @pytest.fixture
 def fallback_recommendation_result(mixed_generation_filter_config, partial_coverage_result):
     """Complete RecommendationResult fixture for fallback recommendation"""
-    from common.coverage_analyzer import RecommendationResult
     return RecommendationResult(
         rank=2,
         filter_config=mixed_generation_filter_config,
@@ -499,8 +604,6 @@ def fallback_recommendation_result(mixed_generation_filter_config, partial_cover
 @pytest.fixture
 def coverage_analyzer_dependencies():
     """Mock dependencies for CoverageAnalyzer testing"""
-    from chart.index_aggregator import IndexAggregator, FilterValidator
-    from common.time_series_aligner import TimeSeriesAligner
 
     return {
         "aggregator": IndexAggregator(),
@@ -9,7 +9,7 @@ Interactive Alignment Workbench.
 import pytest
 import sys
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, FrozenInstanceError
 from typing import Dict, List
 
 # Add parent directory to path for imports
@@ -51,7 +51,7 @@ class TestCoverageResult:
         """Test CoverageResult creation with failed analysis data (0% coverage)"""
         # Act: Use fixture for failed analysis result
         result = failed_coverage_result
-        missing_sigs = failed_coverage_result_data["missing_signatures"]
+        missing_sigs = list(failed_coverage_result_data["missing_signatures"])
 
         # Assert: Verify failed analysis fields are correct
         assert result.filter_config == mixed_generation_filter_config
@@ -114,6 +114,11 @@ class TestCoverageResult:
         assert result_dict["missing_signatures"] == []
         assert result_dict["fallback_required"] is False
 
+    def test_coverage_result_is_frozen(self, successful_coverage_result):
+        """Test CoverageResult rejects field assignment"""
+        with pytest.raises(FrozenInstanceError):
+            successful_coverage_result.quality_score = 0.0
+
     def test_coverage_result_with_none_optional_fields(self, invalid_filter_config):
         """Test CoverageResult creation with None values for optional fields"""
         # Arrange & Act: Create result with None optimal_start_date
@@ -213,19 +218,13 @@ class TestRecommendationResult:
         assert recommendation_dict["coverage_result"]["coverage_percentage"] == 1.0
         assert recommendation_dict["coverage_result"]["signatures_found"] == 13
 
-    def test_recommendation_result_with_alternative_suggestion(self, sv_card_filter_config, alternative_suggestion_result_data):
+    def test_recommendation_result_with_alternative_suggestion(self, sv_card_filter_config, alternative_coverage_result):
         """Test RecommendationResult creation for alternative suggestions from failed filters"""
-        # Arrange: Create CoverageResult for alternative suggestion using fixture data
-        coverage_result = CoverageResult(
-            filter_config=sv_card_filter_config,
-            **alternative_suggestion_result_data
-        )
-
-        # Act: Create RecommendationResult as alternative suggestion
+        # Act: Create RecommendationResult as alternative suggestion using the CoverageResult fixture
         recommendation = RecommendationResult(
             rank=1,
             filter_config=sv_card_filter_config,
-            coverage_result=coverage_result,
+            coverage_result=alternative_coverage_result,
             description="Focus on SV Generation",
             command_string='--sets "SV*" --types "Card" --period "3M"',
             estimated_records=1156
@@ -1,8 +1,9 @@
 import pytest
+import time
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from common.processor import CsvProcessor
+from common.processor import CsvProcessor, _IN_FLIGHT_PER_WORKER
 from common.logger import AppLogger
 
 
@@ -25,7 +26,7 @@ class TestCsvProcessor:
         assert csv_processor.results == []
 
     def test_read_csv_valid_file(self, csv_processor, sample_csv_file):
-        rows = csv_processor._read_csv(sample_csv_file)
+        rows = list(csv_processor._read_csv(sample_csv_file))
 
         assert len(rows) == 3
         assert rows[0]['set'] == 'SV08.5'
@@ -261,4 +262,106 @@ class TestCsvProcessor:
         assert result[2]['period_start_date'] == '2025-07-10'
         assert result[2]['period_end_date'] == '2025-07-12'
         assert result[2]['holofoil_price'] == 1100.00
-        assert result[2]['volume'] == 2
\ No newline at end of file
+        assert result[2]['volume'] == 2
+
+    def test_process_rows_concurrent_fetch_preserves_order(self, csv_processor, sample_csv_data):
+        """Test concurrent fetches still emit records in input row order"""
+        delays = {row['url']: delay for row, delay in zip(sample_csv_data, [0.05, 0.0, 0.02])}
+        csv_processor.web_client = Mock(fetch=lambda url: time.sleep(delays[url]) or url)
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [
+            {'period_start_date': '2025-07-20', 'period_end_date': '2025-07-22',
+             'timestamp': '2025-07-24 15:00:00', 'holofoil_price': 100.0, 'volume': 1}
+        ])
+
+        result = csv_processor._process_rows(sample_csv_data)
+
+        assert [row['name'] for row in result] == [row['name'] for row in sample_csv_data]
+
+    @patch('common.web_client.time.sleep')
+    @patch('common.web_client.time.monotonic', return_value=100.0)
+    def test_process_rows_concurrent_fetches_share_one_rate_limit(self, mock_monotonic, mock_sleep, csv_processor, sample_csv_data):
+        """Test pooled rows wait on the shared WebClient so request starts stay base_delay apart"""
+        csv_processor.web_client.base_delay = 5.0
+        csv_processor.web_client.session = Mock(get=Mock(return_value=Mock(status_code=200, text="ok")))
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [])
+
+        csv_processor._process_rows(sample_csv_data)
+
+        assert sorted(wait for (wait,), _ in mock_sleep.call_args_list) == [0.0, 5.0, 10.0]
+
+    def test_process_rows_reads_a_bounded_window_of_rows(self, csv_processor, sample_csv_data):
+        """Test input rows are pulled only a bounded window ahead of the rows already finished"""
+        finished, outstanding = [], []
+        rows = [dict(sample_csv_data[0], name=f"Card {n}") for n in range(40)]
+
+        def read_rows():
+            for row in rows:
+                # Rows read so far (including this one) that have not finished processing
+                outstanding.append(len(outstanding) + 1 - len(finished))
+                yield row
+
+        csv_processor.max_workers = 2
+        csv_processor._process_row = lambda i, row, timestamp: time.sleep(0.001) or finished.append(i) or [row]
+
+        result = csv_processor._process_rows(read_rows())
+
+        assert [row['name'] for row in result] == [row['name'] for row in rows]
+        assert max(outstanding) <= 2 * _IN_FLIGHT_PER_WORKER + 1
+
+    def test_process_refetches_urls_on_each_run(self, csv_processor, sample_csv_file):
+        """Test a second process() call fetches again instead of reusing the previous run's markdown"""
+        csv_processor.web_client = Mock(fetch=Mock(side_effect=lambda url: page))
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [
+            {'period_start_date': '2025-07-20', 'period_end_date': '2025-07-22',
+             'timestamp': '2025-07-24 15:00:00', 'holofoil_price': float(content), 'volume': 1}
+        ])
+
+        page = '100.0'
+        first = csv_processor.process(sample_csv_file)
+        page = '200.0'
+        second = csv_processor.process(sample_csv_file)
+
+        assert [row['holofoil_price'] for row in first] == [100.0, 100.0, 100.0]
+        assert [row['holofoil_price'] for row in second] == [200.0, 200.0, 200.0]
+        assert csv_processor.web_client.fetch.call_count == 6
+
+    def test_process_rows_fetches_duplicate_urls_once(self, csv_processor, sample_csv_data):
+        """Test rows sharing a URL reuse one fetch while still emitting records per row"""
+        csv_processor.web_client = Mock(fetch=Mock(side_effect=lambda url: time.sleep(0.01) or url))
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [
+            {'period_start_date': '2025-07-20', 'period_end_date': '2025-07-22',
+             'timestamp': '2025-07-24 15:00:00', 'holofoil_price': 100.0, 'volume': 1}
+        ])
+        rows = [dict(sample_csv_data[0], period=period) for period in ('1M', '3M', '6M', '1Y')]
+
+        result = csv_processor._process_rows(rows)
+
+        assert csv_processor.web_client.fetch.call_count == 1
+        assert [row['period'] for row in result] == ['1M', '3M', '6M', '1Y']
+
+    def test_process_rows_shares_one_timestamp_across_rows(self, csv_processor, sample_csv_data):
+        """Test success and error rows in one batch carry the same timestamp"""
+        csv_processor.web_client = Mock(fetch=Mock(side_effect=[Exception("Network error"), 'ok', 'ok']))
+        csv_processor.max_workers = 1
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [
+            {'period_start_date': '2025-07-20', 'period_end_date': '2025-07-22',
+             'timestamp': timestamp, 'holofoil_price': 100.0, 'volume': 1}
+        ])
+
+        result = csv_processor._process_rows(sample_csv_data)
+
+        assert len(result) == 3
+        assert len({row['timestamp'] for row in result}) == 1
+        assert result[0]['timestamp']
+
+    def test_process_rows_accepts_streamed_rows(self, csv_processor, sample_csv_file):
+        """Test rows streamed from _read_csv are processed without materializing a list first"""
+        csv_processor.web_client = Mock()
+        csv_processor.markdown_parser = Mock(parse_price_history_data=lambda content, timestamp=None: [])
+
+        rows = csv_processor._read_csv(sample_csv_file)
+        assert not isinstance(rows, list)
+
+        assert csv_processor._process_rows(rows) == []
+        assert csv_processor.web_client.fetch.call_count == 3
+        assert next(rows, None) is None
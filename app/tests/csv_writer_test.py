@@ -1,5 +1,6 @@
 import pytest
 import csv
+import pandas as pd
 from pathlib import Path
 
 from common.csv_writer import CsvWriter
@@ -163,6 +164,15 @@ class TestCsvWriter:
         assert rows[0]['content'] == 'Content 1'
         assert rows[1]['content'] == ''  # Missing field should be empty string
 
+    def test_write_extra_fields_in_subsequent_rows(self, csv_writer, sample_output_file):
+        test_data = [
+            {'url': 'https://example.com/test1.md', 'name': 'Test 1'},
+            {'url': 'https://example.com/test2.md', 'content': 'Content 2'},  # Same width, unknown field
+        ]
+
+        with pytest.raises(ValueError):
+            csv_writer.write(test_data, sample_output_file)
+
     def test_write_to_nonexistent_directory(self, csv_writer):
         nonexistent_path = Path('/nonexistent/directory/output.csv')
         test_data = [{'test': 'data'}]
@@ -279,4 +289,19 @@ class TestCsvWriter:
             rows = list(reader)
 
         assert len(rows) == 1
-        assert rows[0]['name'] == 'Test Card'
\ No newline at end of file
+        assert rows[0]['name'] == 'Test Card'
+
+    def test_create_key_index_df_matches_dict_index(self, csv_writer, sample_v2_card_data):
+        """Test DataFrame key index matches the list-of-dicts key index"""
+        key_columns = ['set', 'name', 'period_start_date']
+        df = pd.DataFrame(sample_v2_card_data)
+
+        assert csv_writer.create_key_index_df(df, key_columns) == csv_writer.create_key_index(sample_v2_card_data, key_columns)
+
+    def test_normalize_rows_with_missing_source_keys(self, csv_writer):
+        """Test batch normalization renames keys and defaults missing source keys to ''"""
+        schema = {'card': 'name', 'price': 'holofoil'}
+        rows = [{'name': 'Umbreon', 'holofoil': '$1,200.00'}, {'name': 'Pikachu'}]
+
+        assert csv_writer.normalize_rows(rows, schema) == [{'card': 'Umbreon', 'price': '$1,200.00'}, {'card': 'Pikachu', 'price': ''}]
+        assert csv_writer.normalize_row(rows[1], {'card': 'name'}) == {'card': 'Pikachu'}
@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from chart.index_aggregator import IndexAggregator, FilterValidator
+from chart.index_aggregator import IndexAggregator, FilterValidator, _parquet_engine_available
 from common.logger import AppLogger
 
 
@@ -206,6 +206,41 @@ class TestIndexAggregator:
         df = aggregator.read_csv(Path('/nonexistent/file.csv'))
         assert df.empty
 
+    def test_read_csv_keeps_text_fields_and_blank_volume(self, aggregator, tmp_path):
+        """Test text fields are not type-inferred and blank volumes become 0"""
+        csv_path = tmp_path / 'blank.csv'
+        csv_path.write_text("set,type,period,name,period_start_date,period_end_date,timestamp,holofoil_price,volume\n"
+                            "SV01,Card,3M,151,2025-01-01,2025-01-03,2025-07-24 15:00:00,,\n", encoding='utf-8')
+
+        df = aggregator.read_csv(csv_path)
+
+        assert df.loc[0, 'name'] == '151'
+        assert pd.isna(df.loc[0, 'holofoil_price'])
+        assert df.loc[0, 'volume'] == 0
+
+    def test_read_csv_empty_file(self, aggregator, tmp_path):
+        """Test reading a zero-byte CSV file"""
+        csv_path = tmp_path / 'empty.csv'
+        csv_path.write_text('', encoding='utf-8')
+        assert aggregator.read_csv(csv_path).empty
+
+    @patch('chart.index_aggregator.FileHelper.write_csv')
+    @patch('pandas.DataFrame.to_parquet', autospec=True)
+    def test_write_csv_parquet_suffix(self, mock_to_parquet, mock_write, aggregator):
+        """Test a .parquet path writes typed Parquet instead of CSV"""
+        df = pd.DataFrame({
+            'period_end_date': pd.to_datetime(['2025-01-03', '2025-01-06']),
+            'timestamp': [pd.Timestamp('2025-07-24 15:00:00'), '2025-07-25 09:00:00']
+        })
+
+        aggregator.write_csv(df, Path('output.parquet'))
+
+        written_df = mock_to_parquet.call_args.args[0]
+        assert mock_to_parquet.call_args.args[1] == Path('output.parquet')
+        assert mock_to_parquet.call_args.kwargs == {'compression': 'zstd', 'index': False}
+        assert pd.api.types.is_datetime64_any_dtype(written_df['timestamp'])
+        mock_write.assert_not_called()
+
     @patch('chart.index_aggregator.FileHelper.write_csv')
     def test_write_csv_success(self, mock_write, aggregator):
         """Test successful CSV writing"""
@@ -216,13 +251,36 @@ class TestIndexAggregator:
         })
 
         output_path = Path('/test/output.csv')
-        aggregator.write_csv(df, output_path)
+        assert aggregator.write_csv(df, output_path) is True
 
         mock_write.assert_called_once()
         args, kwargs = mock_write.call_args
         assert args[1] == output_path
         assert len(args[0]) == 1  # One record
 
+    @patch('chart.index_aggregator.FileHelper.write_csv', side_effect=OSError("disk full"))
+    def test_write_csv_failure_returns_false(self, mock_write, aggregator):
+        """Test a failed write is reported to the caller instead of only logged"""
+        assert aggregator.write_csv(pd.DataFrame({'set': ['SV01']}), Path('/test/output.csv')) is False
+
+    @pytest.mark.skipif(not _parquet_engine_available(), reason="no Parquet engine (pyarrow or fastparquet) installed")
+    def test_write_csv_parquet_round_trip(self, aggregator, tmp_path):
+        """Test a real Parquet write reads back with typed date columns"""
+        df = pd.DataFrame({
+            'name': ['SV_Box', 'SV_Box'],
+            'period_end_date': ['2025-01-03', '2025-01-06'],
+            'timestamp': [pd.Timestamp('2025-07-24 15:00:00'), '2025-07-25 09:00:00'],
+            'aggregate_price': [100.5, 101.25]
+        })
+        output_path = tmp_path / 'output.parquet'
+
+        assert aggregator.write_csv(df, output_path) is True
+
+        written = pd.read_parquet(output_path)
+        assert written['aggregate_price'].tolist() == [100.5, 101.25]
+        assert pd.api.types.is_datetime64_any_dtype(written['period_end_date'])
+        assert pd.api.types.is_datetime64_any_dtype(written['timestamp'])
+
     def test_apply_filters_all_data(self, aggregator, sample_csv_file):
         """Test applying filters that return all data"""
         df = aggregator.read_csv(sample_csv_file)
@@ -947,6 +1005,23 @@ class TestIndexAggregatorIntegration:
         # Cleanup if file was created
         expected_output.unlink(missing_ok=True)
 
+    @patch('chart.index_aggregator._parquet_engine_available', return_value=False)
+    def test_main_rejects_parquet_without_engine(self, mock_engine, runner, temp_input_file):
+        """Test --format parquet is rejected up front when no Parquet engine is installed"""
+        result = runner.invoke([str(temp_input_file), '--name', 'test_series', '--format', 'parquet'])
+
+        assert result.exit_code == 2  # argparse error
+        assert 'requires pyarrow or fastparquet' in result.stderr
+
+    @patch('chart.index_aggregator.IndexAggregator.write_csv', return_value=False)
+    def test_main_failed_write_does_not_report_success(self, mock_write, runner, temp_input_file):
+        """Test a failed output write exits non-zero without printing a saved-to message"""
+        result = runner.invoke([str(temp_input_file), '--name', 'test_series'])
+
+        assert result.exit_code == 1
+        assert 'saved to' not in result.stdout
+        assert 'Failed to write' in result.stdout
+
     def test_main_missing_args(self, runner):
         """Test command execution with missing arguments"""
         result = runner.invoke([])
@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from main import main
+from main import main, run
 from common.logger import AppLogger
 
 
@@ -110,6 +110,18 @@ class TestMain:
         mock_processor_instance.process.assert_called_once()
         mock_writer_instance.write_unique.assert_called_once()
     
+    @patch('main.CsvProcessor')
+    @patch('main.CsvWriter')
+    def test_run_returns_exit_codes_in_process(self, mock_csv_writer, mock_csv_processor, sample_csv_file, sample_output_file):
+        mock_csv_processor.return_value.process.return_value = []
+        
+        assert run(Path('/nonexistent/input.csv'), sample_output_file) == 1
+        assert run(sample_csv_file, sample_output_file) == 0
+        mock_csv_processor.assert_called_once_with(cache_dir=None)
+        
+        mock_csv_processor.return_value.process.side_effect = Exception("Processing failed")
+        assert run(sample_csv_file, sample_output_file) == 1
+    
     def test_main_invalid_arguments(self, runner):
         result = runner.invoke(main, ['--invalid-flag'])
         
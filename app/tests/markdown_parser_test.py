@@ -280,4 +280,34 @@ More content after table.
         assert result[1]['period_start_date'] == '2025-04-23'
         assert result[1]['period_end_date'] == '2025-04-25'
         assert result[1]['holofoil_price'] == 0.0
-        assert result[1]['volume'] == 0
\ No newline at end of file
+        assert result[1]['volume'] == 0
+
+    def test_parse_price_history_data_cached_records_are_not_shared(self, markdown_parser):
+        content = """
+| Date | Holofoil |
+| --- | --- |
+| 4/20 to 4/22 | $1,451.66 | $0.00 |
+"""
+        first = markdown_parser.parse_price_history_data(content)
+        first[0]['holofoil_price'] = -1.0
+        second = markdown_parser.parse_price_history_data(content)
+
+        assert second[0]['holofoil_price'] == 1451.66
+        assert second[0] is not first[0]
+
+    def test_parse_table_records_cache_is_keyed_by_year(self):
+        table = "| Date | Holofoil |\n| --- | --- |\n| 12/30 to 1/1 | $1.00 | $0.00 |"
+
+        assert MarkdownParser._parse_table_records(table, 2025)[0][:2] == ('2025-12-30', '2026-01-01')
+        assert MarkdownParser._parse_table_records(table, 2026)[0][:2] == ('2026-12-30', '2027-01-01')
+
+    def test_parse_price_history_data_uses_given_timestamp(self, markdown_parser):
+        content = """
+| Date | Holofoil |
+| --- | --- |
+| 4/20 to 4/22 | $1,451.66 | $0.00 |
+| 4/23 to 4/25 | $1,500.00 | $1.00 |
+"""
+        result = markdown_parser.parse_price_history_data(content, timestamp='2025-07-24 15:00:00')
+
+        assert [row['timestamp'] for row in result] == ['2025-07-24 15:00:00'] * 2
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Time Series Aligner functionality
+
+Tests the TimeSeriesAligner completeness-only alignment steps on small
+hand-built price history DataFrames.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.time_series_aligner import TimeSeriesAligner
+from common.logger import AppLogger
+
+
+def _record(name: str, end_date: str, price: float, volume: int = 1) -> dict:
+    """Build one v2.0 price record for a 3-day period ending on end_date"""
+    end = pd.Timestamp(end_date)
+    return {
+        'set': 'SV01', 'type': 'Card', 'period': '3M', 'name': name,
+        'period_start_date': end - pd.Timedelta(days=2), 'period_end_date': end,
+        'timestamp': pd.Timestamp('2025-06-01 10:00:00'),
+        'holofoil_price': price, 'volume': volume
+    }
+
+
+@pytest.fixture
+def aligner():
+    return TimeSeriesAligner()
+
+
+@pytest.fixture
+def gapped_df():
+    """Two signatures over four dates; 'Beta' misses the last two dates and 'Alpha' has a NaN price"""
+    return pd.DataFrame([
+        _record('Alpha', '2025-01-01', 10.0),
+        _record('Beta', '2025-01-01', 20.0),
+        _record('Alpha', '2025-01-04', np.nan),
+        _record('Beta', '2025-01-04', 21.0, volume=5),
+        _record('Alpha', '2025-01-07', 12.0),
+        _record('Alpha', '2025-01-10', 13.0),
+    ])
+
+
+class TestTimeSeriesAligner:
+    """Test cases for TimeSeriesAligner alignment steps"""
+
+    @classmethod
+    def setup_class(cls):
+        """Setup logging for all tests in this class."""
+        AppLogger().setup_logging(verbose=True, log_file="test.log")
+
+    def test_find_first_complete_coverage_date(self, aligner, gapped_df):
+        """Test the first date on which every signature has a record is selected"""
+        date, coverage_pct = aligner._1_find_first_complete_coverage_date(gapped_df)
+
+        assert date == pd.Timestamp('2025-01-01')
+        assert coverage_pct == 100.0
+
+    def test_find_first_complete_coverage_date_fallback(self, aligner, gapped_df):
+        """Test partial coverage returns None unless fallback picks the earliest best-covered date"""
+        partial_df = gapped_df.drop(index=[1, 2])
+
+        assert aligner._1_find_first_complete_coverage_date(partial_df) == (None, 0.0)
+        assert aligner._1_find_first_complete_coverage_date(partial_df, allow_fallback=True) == (pd.Timestamp('2025-01-01'), 50.0)
+
+    def test_rows_from_date_matches_boolean_filter(self, aligner, gapped_df):
+        """Test sorted frames use a positional slice and unsorted frames a mask selecting the same rows"""
+        sorted_df = gapped_df.sort_values('period_end_date')
+        unsorted_df = gapped_df.iloc[::-1]
+        start = pd.Timestamp('2025-01-04')
+
+        assert aligner._rows_from_date(sorted_df, start) == slice(2, None)
+        for frame in (sorted_df, unsorted_df):
+            assert frame.iloc[aligner._rows_from_date(frame, start)].equals(frame[frame['period_end_date'] >= start])
+
+    def test_fill_gaps_copies_latest_original_record(self, aligner, gapped_df):
+        """Test gaps are filled from the most recent original record of the missing signature"""
+        result = aligner._2_fill_signature_gaps_after_first_complete_date(gapped_df, pd.Timestamp('2025-01-01'))
+
+        beta = result[result['name'] == 'Beta'].reset_index(drop=True)
+        assert len(result) == 8
+        assert list(beta['period_end_date']) == list(pd.to_datetime(['2025-01-01', '2025-01-04', '2025-01-07', '2025-01-10']))
+        assert list(beta['holofoil_price']) == [20.0, 21.0, 21.0, 21.0]
+        assert list(beta['volume']) == [1, 5, 5, 5]
+        assert all(isinstance(ts, str) for ts in beta['timestamp'][2:])
+
+    def test_fill_gaps_keeps_original_nan_values(self, aligner, gapped_df):
+        """Test genuine NaN values in original rows are not forward-filled column by column"""
+        result = aligner._2_fill_signature_gaps_after_first_complete_date(gapped_df, pd.Timestamp('2025-01-01'))
+
+        alpha = result[result['name'] == 'Alpha'].reset_index(drop=True)
+        assert len(alpha) == 4
+        assert np.isnan(alpha.loc[1, 'holofoil_price'])
+
+    def test_fill_gaps_without_gaps_returns_rows_from_start_date(self, aligner, gapped_df):
+        """Test complete coverage returns the original rows from the start date unchanged"""
+        complete_df = gapped_df[gapped_df['period_end_date'] <= '2025-01-04']
+
+        result = aligner._2_fill_signature_gaps_after_first_complete_date(complete_df, pd.Timestamp('2025-01-04'))
+
+        assert result.equals(complete_df[complete_df['period_end_date'] >= '2025-01-04'])
+
+    def test_align_complete_returns_full_signature_grid(self, aligner, gapped_df):
+        """Test align_complete yields every signature on every date from the first complete date"""
+        result = aligner.align_complete(gapped_df)
+
+        assert len(result) == 8
+        assert result.groupby('period_end_date').size().tolist() == [2, 2, 2, 2]
+
+    def test_align_complete_result_does_not_share_input_memory(self, aligner, gapped_df):
+        """Test editing the aligned result leaves the caller's frame untouched when no gaps are filled"""
+        complete_df = gapped_df[gapped_df['period_end_date'] <= '2025-01-04'].sort_values('period_end_date')
+        original = complete_df.copy()
+
+        result = aligner.align_complete(complete_df)
+        result.iloc[0, result.columns.get_loc('holofoil_price')] = -1.0
+
+        assert complete_df.equals(original)
+
+    def test_align_complete_fallback_reports_incomplete_dates(self, aligner):
+        """Test fallback alignment warns with per-date counts for dates still missing signatures"""
+        partial_df = pd.DataFrame([
+            _record('Alpha', '2025-01-01', 10.0),
+            _record('Alpha', '2025-01-04', 11.0),
+            _record('Beta', '2025-01-07', 20.0),
+        ])
+        aligner.logger = Mock()
+
+        result = aligner.align_complete(partial_df, allow_fallback=True)
+
+        assert len(result) == 4
+        aligner.logger.warning.assert_any_call("Dates with incomplete signature coverage: 2025-01-01: 1/2 (50.0%), 2025-01-04: 1/2 (50.0%)")
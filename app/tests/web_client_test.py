@@ -30,6 +30,12 @@ class TestWebClient:
         assert client.timeout == 60
         assert client.base_delay == 0.01
     
+    def test_init_pool_size_matches_concurrency(self):
+        client = WebClient(base_delay=0.01, pool_size=16)
+        adapter = client.session.get_adapter("https://www.tcgplayer.com/product/1")
+        assert adapter._pool_maxsize == 16
+        assert client.session.get_adapter("http://example.com") is adapter
+    
     @patch('common.web_client.requests.Session')
     def test_fetch_success(self, mock_session, web_client):
         # Setup mock
@@ -49,9 +55,52 @@ class TestWebClient:
         result = client.fetch("https://r.jina.ai/https://www.tcgplayer.com/product/610516/test")
         
         assert result == "Test content"
-        mock_session_instance.get.assert_called_once_with("https://r.jina.ai/https://www.tcgplayer.com/product/610516/test", timeout=30)
+        mock_session_instance.get.assert_called_once_with("https://r.jina.ai/https://www.tcgplayer.com/product/610516/test", timeout=30, headers={})
         mock_response.raise_for_status.assert_called_once()
     
+    def test_fetch_many_returns_contents_in_order(self):
+        client = WebClient(base_delay=0.01)
+        client.session = Mock()
+        client.session.get.side_effect = lambda url, timeout, headers: Mock(status_code=200, text=f"content of {url}")
+        urls = [f"https://r.jina.ai/https://www.tcgplayer.com/product/{i}/test" for i in range(5)]
+        
+        result = client.fetch_many(urls, max_workers=3)
+        
+        assert result == [f"content of {url}" for url in urls]
+        assert client.session.get.call_count == 5
+    
+    @patch('common.web_client.ThreadPoolExecutor')
+    def test_fetch_many_caps_workers_at_pool_size(self, mock_executor):
+        mock_executor.return_value.__enter__.return_value.map.return_value = iter(["ok"])
+        client = WebClient(base_delay=0.01, pool_size=2)
+        
+        client.fetch_many(["https://example.com/a"], max_workers=8)
+        
+        mock_executor.assert_called_once_with(max_workers=2)
+    
+    @patch('common.web_client.time.sleep')
+    @patch('common.web_client.time.monotonic', return_value=100.0)
+    def test_fetch_many_spaces_requests_across_workers(self, mock_monotonic, mock_sleep):
+        client = WebClient(base_delay=5.0)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=200, text="ok")
+        
+        client.fetch_many(["https://example.com/a", "https://example.com/b", "https://example.com/c"], max_workers=3)
+        
+        assert sorted(wait for (wait,), _ in mock_sleep.call_args_list) == [0.0, 5.0, 10.0]
+    
+    @patch('common.web_client.time.sleep')
+    @patch('common.web_client.time.monotonic', return_value=100.0)
+    def test_fetch_and_fetch_many_share_one_rate_limit(self, mock_monotonic, mock_sleep):
+        client = WebClient(base_delay=5.0)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=200, text="ok")
+        
+        client.fetch("https://example.com/a")
+        client.fetch_many(["https://example.com/b"])
+        
+        assert [wait for (wait,), _ in mock_sleep.call_args_list] == [0.0, 5.0]
+    
     @patch('common.web_client.requests.Session')
     def test_fetch_http_error(self, mock_session, web_client):
         # Setup mock to raise HTTP error
@@ -114,5 +163,44 @@ class TestWebClient:
         with pytest.raises(requests.exceptions.ConnectTimeout):
             web_client.fetch("https://r.jina.ai/https://www.tcgplayer.com/product/567429/pokemon-sv07-stellar-crown-squirtle?page=1&Language=English")
     
+    def test_fetch_cache_hit_skips_network(self, tmp_path):
+        client = WebClient(base_delay=0.01, cache_dir=tmp_path)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=200, text="Cached content", headers={'ETag': '"v1"'})
+        url = "https://r.jina.ai/https://www.tcgplayer.com/product/610516/test"
+        
+        assert client.fetch(url) == "Cached content"
+        assert WebClient(base_delay=0.01, cache_dir=tmp_path).fetch(url) == "Cached content"
+        client.session.get.assert_called_once_with(url, timeout=30, headers={})
+    
+    def test_fetch_stale_cache_revalidates_with_etag(self, tmp_path):
+        client = WebClient(base_delay=0.01, cache_dir=tmp_path, cache_ttl=0)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=200, text="Original content", headers={'ETag': '"v1"'})
+        url = "https://r.jina.ai/https://www.tcgplayer.com/product/610516/test"
+        client.fetch(url)
+        
+        client.session.get.return_value = Mock(status_code=304, text="", headers={})
+        
+        assert client.fetch(url) == "Original content"
+        client.session.get.assert_called_with(url, timeout=30, headers={'If-None-Match': '"v1"'})
+    
+    def test_fetch_unconditional_304_raises_and_is_not_cached(self, tmp_path):
+        client = WebClient(base_delay=0.01, max_retries=1, cache_dir=tmp_path)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=304, text="", headers={})
+        
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.fetch("https://r.jina.ai/https://www.tcgplayer.com/product/610516/test")
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_fetch_non_200_success_is_not_cached(self, tmp_path):
+        client = WebClient(base_delay=0.01, cache_dir=tmp_path)
+        client.session = Mock()
+        client.session.get.return_value = Mock(status_code=204, text="", headers={})
+        
+        assert client.fetch("https://r.jina.ai/https://www.tcgplayer.com/product/610516/test") == ""
+        assert list(tmp_path.iterdir()) == []
+    
     def test_user_agent_header(self, web_client):
         assert web_client.session.headers['User-Agent'] == 'CSVProcessor/1.0'
\ No newline at end of file